@@ -0,0 +1,72 @@
+"""initial schema: user and detection tables
+
+Revision ID: 1b6d0e4f2a97
+Revises: 
+Create Date: 2026-10-14 09:05:12.287341
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = '1b6d0e4f2a97'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tables as originally created by SQLModel.metadata.create_all; later
+    # revisions add the keyset index and server-side timestamps on top.
+    # Databases created that way already have these tables and should be
+    # marked with `alembic stamp 1b6d0e4f2a97` before `alembic upgrade head`.
+    op.create_table(
+        'user',
+        sa.Column('email', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('is_superuser', sa.Boolean(), nullable=False),
+        sa.Column('full_name', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True),
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('hashed_password', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_user_email', 'user', ['email'], unique=True)
+    op.create_table(
+        'detection',
+        sa.Column('user_id', sa.Uuid(), nullable=True),
+        sa.Column('media_type', sa.Enum('IMAGE', 'VIDEO', name='mediatype'), nullable=False),
+        sa.Column('file_name', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column('file_path', sqlmodel.sql.sqltypes.AutoString(length=500), nullable=False),
+        sa.Column('file_size', sa.Integer(), nullable=False),
+        sa.Column(
+            'status',
+            sa.Enum('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED', name='detectionstatus'),
+            nullable=False,
+        ),
+        sa.Column(
+            'result',
+            sa.Enum('REAL', 'FAKE', 'UNCERTAIN', name='detectionresult'),
+            nullable=True,
+        ),
+        sa.Column('confidence_score', sa.Float(), nullable=True),
+        sa.Column('processing_time_seconds', sa.Float(), nullable=True),
+        sa.Column('error_message', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('detection')
+    op.drop_index('ix_user_email', table_name='user')
+    op.drop_table('user')
+    sa.Enum(name='detectionresult').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='detectionstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='mediatype').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,33 @@
+"""add detection (user_id, created_at, id) index
+
+Revision ID: 3f2a9c1d7b40
+Revises: 1b6d0e4f2a97
+Create Date: 2026-10-14 09:12:31.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c1d7b40'
+down_revision = '1b6d0e4f2a97'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_detection_user_id_created_at_id',
+        'detection',
+        ['user_id', 'created_at', 'id'],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_detection_user_id_created_at_id',
+        table_name='detection',
+        if_exists=True,
+    )
@@ -0,0 +1,30 @@
+"""ensure unique index on user.email
+
+Revision ID: 8d41e6b2c915
+Revises: 3f2a9c1d7b40
+Create Date: 2026-10-14 10:03:47.915262
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d41e6b2c915'
+down_revision = '3f2a9c1d7b40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_user_email',
+        'user',
+        ['email'],
+        unique=True,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_email', table_name='user', if_exists=True)
@@ -0,0 +1,53 @@
+"""server-side timestamps on user and detection
+
+Revision ID: c7e05b93a1f8
+Revises: 8d41e6b2c915
+Create Date: 2026-10-14 11:26:05.118734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e05b93a1f8'
+down_revision = '8d41e6b2c915'
+branch_labels = None
+depends_on = None
+
+TABLES = ('user', 'detection')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        # Existing values were written naively by datetime.utcnow()
+        op.alter_column(
+            table,
+            'created_at',
+            type_=sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            postgresql_using="created_at AT TIME ZONE 'UTC'",
+        )
+        op.alter_column(
+            table,
+            'updated_at',
+            type_=sa.DateTime(timezone=True),
+            postgresql_using="updated_at AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table,
+            'updated_at',
+            type_=sa.DateTime(),
+            postgresql_using="updated_at AT TIME ZONE 'UTC'",
+        )
+        op.alter_column(
+            table,
+            'created_at',
+            type_=sa.DateTime(),
+            server_default=None,
+            postgresql_using="created_at AT TIME ZONE 'UTC'",
+        )
@@ -1,3 +1,4 @@
+import functools
 from typing import Annotated
 from collections.abc import Generator
 from fastapi import Depends, HTTPException, status
@@ -5,8 +6,8 @@ from fastapi.security import OAuth2PasswordBearer
 import jwt
 from pydantic import ValidationError
 from sqlmodel import Session
-from app.core import security
-from app.db.main import engine
+from app.core import auth_cache, security
+from app.db.main import SessionLocal
 from app.models.entities.authentication import TokenPayload
 from app.models.schemas.users import User
 from app.core.config import settings
@@ -16,13 +17,34 @@ reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/authentication/access-token"
 )
 
+# Token verification bound once at import rather than rebuilt per request
+_decode_token = functools.partial(
+    jwt.decode,
+    key=settings.SECRET_KEY.encode(),
+    algorithms=[security.ALGORITHM],
+    options={"require": ["exp", "sub"]},
+)
+_validate_payload = TokenPayload.model_validate
+
+# Auth failure messages, shared as constants. Each failure still raises its own
+# HTTPException: raising sets __traceback__/__context__ on the instance, so one
+# shared across threadpool requests would be overwritten concurrently and keep
+# the last failing request's frames alive.
+CREDENTIALS_DETAIL = "Could not validate credentials"
+USER_NOT_FOUND_DETAIL = "User not found"
+INACTIVE_DETAIL = "Inactive user"
+PRIVILEGES_DETAIL = "The user doesn't have enough privileges"
+
 # Dependency to get the database session
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency to get the database session.
     """
-    with Session(engine) as session:
+    session = SessionLocal()
+    try:
         yield session
+    finally:
+        session.close()
 
 SessionDep = Annotated[Session, Depends(get_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
@@ -32,21 +54,27 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
     """
     Dependency to get the current user from the token.
     """
+    cache_key = auth_cache.token_key(token) if auth_cache.is_enabled() else None
+    if cache_key is not None:
+        cached_user = auth_cache.get_cached_user(cache_key)
+        if cached_user is not None:
+            return cached_user
+
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
+        payload = _decode_token(token)
+        token_data = _validate_payload(payload)
     except (InvalidTokenError, ValidationError):
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
-        )
+            status_code=status.HTTP_403_FORBIDDEN, detail=CREDENTIALS_DETAIL
+        ) from None
     user = session.get(User, token_data.sub)
     if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+        raise HTTPException(status_code=404, detail=USER_NOT_FOUND_DETAIL)
     if not user.is_active:
-        raise HTTPException(status_code=400, detail="Inactive user")
+        raise HTTPException(status_code=400, detail=INACTIVE_DETAIL)
+    if cache_key is not None:
+        # Cached as an immutable snapshot; hits build their own User from it
+        auth_cache.cache_user(cache_key, user, payload.get("exp"))
     return user
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
@@ -56,7 +84,5 @@ def get_current_active_superuser(current_user: CurrentUser) -> User:
     Dependency to check if the current user is an active superuser.
     """
     if not current_user.is_superuser:
-        raise HTTPException(
-            status_code=403, detail="The user doesn't have enough privileges"
-        )
+        raise HTTPException(status_code=403, detail=PRIVILEGES_DETAIL)
     return current_user
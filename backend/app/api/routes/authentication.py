@@ -1,3 +1,4 @@
+import logging
 from datetime import timedelta
 from typing import Annotated
 
@@ -11,6 +12,8 @@ from app.models.entities.authentication import Token
 from app.models.repositories.users import UserRepository
 from app.services.users import UserService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/authentication", tags=["authentication"])
 
 @router.post("/access-token")
@@ -25,10 +28,10 @@ def login_access_token(
         user = user_service.authenticate_user(
             email=form_data.username, password=form_data.password
         )
+        # Inactive users are rejected inside authenticate, before bcrypt, so
+        # they get the same error as a wrong password
         if not user:
             raise ValueError("Incorrect email or password")
-        elif not user.is_active:
-            raise ValueError("Inactive user")
         
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         return Token(
@@ -38,8 +41,8 @@ def login_access_token(
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        print(f"Error in login_access_token: {str(e)}")
+    except Exception:
+        logger.exception("login_access_token failed")
         raise HTTPException(status_code=500, detail="An error occurred during authentication")
 
 @router.post("/test-token")
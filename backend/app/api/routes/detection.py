@@ -1,7 +1,12 @@
+import contextlib
+import logging
+import os
 import uuid
 from typing import Any, Optional
 
+import aiofiles
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query
+from fastapi.concurrency import run_in_threadpool
 
 from app.api.deps import CurrentUser, SessionDep
 from app.models.entities.detection import DetectionRequest, DetectionResponse, DetectionListResponse
@@ -11,8 +16,14 @@ from app.models.schemas.detection import DetectionCreate
 from app.services.detection import DetectionService
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/detection", tags=["detection"])
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MAX_FILE_SIZE = settings.MAX_FILE_SIZE_MB * 1024 * 1024
+FILE_TOO_LARGE_MESSAGE = f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE_MB}MB"
+
 @router.post("/upload", response_model=DetectionResponse)
 async def upload_media_for_detection(
     *,
@@ -27,60 +38,83 @@ async def upload_media_for_detection(
     """
     try:
         # Validate file size
-        if file.size and file.size > settings.MAX_FILE_SIZE_MB * 1024 * 1024:
-            raise ValueError(f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE_MB}MB")
+        if file.size and file.size > MAX_FILE_SIZE:
+            raise ValueError(FILE_TOO_LARGE_MESSAGE)
 
         # Validate file extension
         file_extension = file.filename.split('.')[-1].lower() if file.filename else ""
         if media_type == MediaType.IMAGE:
-            allowed_extensions = [ext.lstrip('.') for ext in settings.ALLOWED_IMAGE_EXTENSIONS]
+            allowed_extensions = settings.allowed_image_exts
         else:
-            allowed_extensions = [ext.lstrip('.') for ext in settings.ALLOWED_VIDEO_EXTENSIONS]
-        
+            allowed_extensions = settings.allowed_video_exts
+
         if file_extension not in allowed_extensions:
             raise ValueError(f"File extension '{file_extension}' not allowed for {media_type.value} files")
 
-        # TODO: Implement file storage logic here
-        # For now, we'll create a mock file path
-        file_path = f"uploads/{current_user.id}/{file.filename}"
-        file_size = file.size or 0
-
-        detection_create = DetectionCreate(
-            user_id=current_user.id,
-            media_type=media_type,
-            file_name=file.filename or "unknown",
-            file_path=file_path,
-            file_size=file_size,
-            status=DetectionStatus.PENDING
-        )
+        # Stored under a unique name so a second upload of the same filename
+        # can't overwrite a file an earlier detection still points at
+        file_name = os.path.basename(file.filename) if file.filename else "unknown"
+        file_path = os.path.join("uploads", str(current_user.id), f"{uuid.uuid4().hex}.{file_extension}")
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-        detection_service = DetectionService(repository=DetectionRepository(session))
-        detection = detection_service.create_detection(detection_create)
+        try:
+            # Stream the upload to disk in fixed-size chunks rather than buffering it
+            file_size = 0
+            async with aiofiles.open(file_path, "wb") as out:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    if file_size > MAX_FILE_SIZE:
+                        raise ValueError(FILE_TOO_LARGE_MESSAGE)
+                    await out.write(chunk)
+
+            detection_create = DetectionCreate(
+                user_id=current_user.id,
+                media_type=media_type,
+                file_name=file_name,
+                file_path=file_path,
+                file_size=file_size,
+                status=DetectionStatus.PENDING
+            )
+
+            detection_service = DetectionService(repository=DetectionRepository(session))
+            # This handler runs on the event loop; keep the blocking DB write off it
+            detection = await run_in_threadpool(
+                detection_service.create_detection, detection_create
+            )
+        except BaseException:
+            # No detection row references the file, so don't leave it on disk
+            with contextlib.suppress(OSError):
+                os.remove(file_path)
+            raise
         
-        return DetectionResponse(**detection.model_dump())
+        return DetectionResponse.model_validate(detection)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        print(f"Error in upload_media_for_detection: {str(e)}")
+    except Exception:
+        logger.exception("upload_media_for_detection failed")
         raise HTTPException(status_code=500, detail="An error occurred processing the upload")
 
 @router.get("/", response_model=DetectionListResponse)
 def get_user_detections(
     session: SessionDep,
     current_user: CurrentUser,
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None),
     per_page: int = Query(20, ge=1, le=100)
 ) -> Any:
     """
-    Get user's detection history with pagination.
+    Get user's detection history, newest first.
+
+    Pass the returned next_cursor back as ?cursor= to fetch the following page.
     """
     try:
         detection_service = DetectionService(repository=DetectionRepository(session))
-        return detection_service.get_user_detections(current_user.id, page=page, per_page=per_page)
+        return detection_service.get_user_detections_by_cursor(
+            current_user.id, cursor=cursor, per_page=per_page
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        print(f"Error in get_user_detections: {str(e)}")
+    except Exception:
+        logger.exception("get_user_detections failed")
         raise HTTPException(status_code=500, detail="An error occurred retrieving detections")
 
 @router.get("/{detection_id}", response_model=DetectionResponse)
@@ -103,13 +137,13 @@ def get_detection_by_id(
         if detection.user_id != current_user.id and not current_user.is_superuser:
             raise HTTPException(status_code=403, detail="Not enough permissions")
             
-        return DetectionResponse(**detection.model_dump())
+        return DetectionResponse.model_validate(detection)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except HTTPException:
         raise
-    except Exception as e:
-        print(f"Error in get_detection_by_id: {str(e)}")
+    except Exception:
+        logger.exception("get_detection_by_id failed")
         raise HTTPException(status_code=500, detail="An error occurred retrieving the detection")
 
 @router.delete("/{detection_id}")
@@ -123,24 +157,28 @@ def delete_detection(
     """
     try:
         detection_service = DetectionService(repository=DetectionRepository(session))
-        detection = detection_service.get_detection_by_id(detection_id)
-        
-        if not detection:
+
+        owner_id = detection_service.get_detection_owner(detection_id)
+        if not owner_id:
             raise ValueError(f"Detection with ID {detection_id} not found")
-        
+
         # Users can only delete their own detections unless they're superuser
-        if detection.user_id != current_user.id and not current_user.is_superuser:
+        if owner_id != current_user.id and not current_user.is_superuser:
             raise HTTPException(status_code=403, detail="Not enough permissions")
-            
-        success = detection_service.delete_detection(detection_id)
-        if not success:
-            raise Exception("Failed to delete detection")
-            
+
+        file_path = detection_service.delete_detection(detection_id, user_id=owner_id)
+        if file_path is None:
+            raise ValueError(f"Detection with ID {detection_id} not found")
+
+        # The row is gone, so nothing references the upload any more
+        with contextlib.suppress(OSError):
+            os.remove(file_path)
+
         return {"message": "Detection deleted successfully"}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except HTTPException:
         raise
-    except Exception as e:
-        print(f"Error in delete_detection: {str(e)}")
+    except Exception:
+        logger.exception("delete_detection failed")
         raise HTTPException(status_code=500, detail="An error occurred deleting the detection")
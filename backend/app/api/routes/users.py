@@ -1,13 +1,17 @@
+import logging
 import uuid
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
 from app.api.deps import CurrentUser, SessionDep
+from app.core import auth_cache
 from app.models.entities.users import UserCreate, UserResponse, UserUpdate
 from app.models.repositories.users import UserRepository
 from app.services.users import UserService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/users", tags=["users"])
 
 @router.get("/me", response_model=UserResponse)
@@ -15,7 +19,7 @@ def read_user_me(current_user: CurrentUser) -> Any:
     """
     Get current user.
     """
-    return UserResponse(**current_user.model_dump())
+    return UserResponse.model_validate(current_user)
 
 @router.post("/", response_model=UserResponse)
 def create_user(*, session: SessionDep, user_in: UserCreate) -> Any:
@@ -25,11 +29,11 @@ def create_user(*, session: SessionDep, user_in: UserCreate) -> Any:
     try:
         user_service = UserService(repository=UserRepository(session))
         user = user_service.create_user(user_in)
-        return UserResponse(**user.model_dump())
+        return UserResponse.model_validate(user)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        print(f"Error in create_user: {str(e)}")
+    except Exception:
+        logger.exception("create_user failed")
         raise HTTPException(status_code=500, detail="An error occurred creating the user")
 
 @router.patch("/me", response_model=UserResponse)
@@ -42,11 +46,12 @@ def update_user_me(
     try:
         user_service = UserService(repository=UserRepository(session))
         user = user_service.update_user(current_user.id, user_in)
-        return UserResponse(**user.model_dump())
+        auth_cache.invalidate_user(user.id)
+        return UserResponse.model_validate(user)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        print(f"Error in update_user_me: {str(e)}")
+    except Exception:
+        logger.exception("update_user_me failed")
         raise HTTPException(status_code=500, detail="An error occurred updating the user")
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -66,11 +71,11 @@ def read_user_by_id(
         if user.id != current_user.id and not current_user.is_superuser:
             raise HTTPException(status_code=403, detail="Not enough permissions")
             
-        return UserResponse(**user.model_dump())
+        return UserResponse.model_validate(user)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except HTTPException:
         raise
-    except Exception as e:
-        print(f"Error in read_user_by_id: {str(e)}")
+    except Exception:
+        logger.exception("read_user_by_id failed")
         raise HTTPException(status_code=500, detail="An error occurred retrieving the user")
@@ -0,0 +1,103 @@
+import time
+import uuid
+from typing import Optional
+
+import redis
+from pydantic import BaseModel, ValidationError
+
+from app.core import jwt_cache
+from app.core.config import settings
+from app.core.jwt_cache import CachedUser
+from app.models.schemas.users import User
+
+# Shared tier behind the process-local token cache; only used when REDIS_URL is set
+_redis = (
+    redis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.5)
+    if settings.REDIS_URL
+    else None
+)
+
+class CachedEntry(BaseModel):
+    user: CachedUser
+    expires_at: float
+
+def is_enabled() -> bool:
+    return jwt_cache.is_enabled()
+
+def token_key(token: str) -> bytes:
+    return jwt_cache.token_key(token)
+
+def _redis_token_key(key: bytes) -> str:
+    return f"jwt:{key.hex()[:32]}"
+
+def _redis_user_tokens_key(user_id: uuid.UUID) -> str:
+    return f"user:{user_id}:tokens"
+
+def get_cached_user(key: bytes) -> Optional[User]:
+    """Look a token up locally first, then in Redis"""
+    user = jwt_cache.get_cached_user(key)
+    if user is not None or _redis is None:
+        return user
+
+    redis_key = _redis_token_key(key)
+    try:
+        raw = _redis.get(redis_key)
+    except redis.RedisError:
+        return None
+    if raw is None:
+        return None
+
+    try:
+        entry = CachedEntry.model_validate_json(raw)
+    except ValidationError:
+        # Corrupt, or written by an older schema: treat as a miss and drop it
+        # so the caller verifies against the database and re-caches
+        try:
+            _redis.delete(redis_key)
+        except redis.RedisError:
+            pass
+        return None
+    if entry.expires_at <= time.time():
+        return None
+    jwt_cache.cache_snapshot(key, entry.user, entry.expires_at)
+    return entry.user.to_user()
+
+def cache_user(key: bytes, user: User, exp: Optional[float]) -> None:
+    """Cache a verified user in both tiers, never past the token's own expiry"""
+    snapshot = CachedUser.model_validate(user)
+    expires_at = jwt_cache.expiry(exp)
+    jwt_cache.cache_snapshot(key, snapshot, expires_at)
+    if _redis is None:
+        return
+
+    ttl = int(expires_at - time.time())
+    if ttl <= 0:
+        return
+
+    entry = CachedEntry(user=snapshot, expires_at=expires_at)
+    redis_key = _redis_token_key(key)
+    user_tokens_key = _redis_user_tokens_key(user.id)
+    try:
+        pipe = _redis.pipeline()
+        pipe.setex(redis_key, ttl, entry.model_dump_json())
+        pipe.sadd(user_tokens_key, redis_key)
+        pipe.expire(user_tokens_key, settings.JWT_CACHE_TTL)
+        pipe.execute()
+    except redis.RedisError:
+        pass
+
+def invalidate_user(user_id: uuid.UUID) -> None:
+    """
+    Forget a user's cached tokens after their record changes. Other workers'
+    local copies still age out within JWT_CACHE_TTL.
+    """
+    jwt_cache.invalidate_user(user_id)
+    if _redis is None:
+        return
+
+    user_tokens_key = _redis_user_tokens_key(user_id)
+    try:
+        token_keys = _redis.smembers(user_tokens_key)
+        _redis.delete(*token_keys, user_tokens_key)
+    except redis.RedisError:
+        pass
@@ -1,4 +1,5 @@
 import secrets
+from functools import cached_property
 from typing import Any
 from pydantic import computed_field
 from pydantic_core import MultiHostUrl
@@ -22,16 +23,23 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "Deepfake Detector API"
     ENVIRONMENT: str = "local"
+    SENTRY_DSN: str | None = None
     
     # Security
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+
+    # Verified-token cache (seconds; 0 disables it)
+    JWT_CACHE_TTL: int = 0
+    JWT_CACHE_MAX: int = 10000
+    # Optional Redis tier so all workers share the verified-token cache
+    REDIS_URL: str | None = None
     
     # CORS
     BACKEND_CORS_ORIGINS: str = "http://localhost:3000,http://localhost:8000"
 
     @computed_field
-    @property
+    @cached_property
     def all_cors_origins(self) -> list[str]:
         return [origin.strip() for origin in self.BACKEND_CORS_ORIGINS.split(",")]
 
@@ -41,10 +49,13 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "deepfake_user"
     POSTGRES_PASSWORD: str = "changethis"
     POSTGRES_DB: str = "deepfake_detector"
+    POSTGRES_SSL_MODE: str = "prefer"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
 
     @computed_field
-    @property
-    def SQLALCHEMY_DATABASE_URI(self):
+    @cached_property
+    def SQLALCHEMY_DATABASE_URI(self) -> MultiHostUrl:
         return MultiHostUrl.build(
             scheme="postgresql+psycopg2",
             username=self.POSTGRES_USER,
@@ -54,11 +65,29 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    @computed_field
+    @cached_property
+    def database_uri(self) -> str:
+        return f"{self.SQLALCHEMY_DATABASE_URI}?sslmode={self.POSTGRES_SSL_MODE}"
+
     # User Configuration
     FIRST_SUPERUSER: str = "admin@deepfakedetector.com"
     FIRST_SUPERUSER_PASSWORD: str = "changethis"
+    EMAIL_TEST_USER: str = "test@example.com"
 
     # File Upload Configuration
     MAX_FILE_SIZE_MB: int = 50
+    ALLOWED_IMAGE_EXTENSIONS: list[str] = [".jpg", ".jpeg", ".png", ".bmp"]
+    ALLOWED_VIDEO_EXTENSIONS: list[str] = [".mp4", ".avi", ".mov", ".mkv"]
+
+    @computed_field
+    @cached_property
+    def allowed_image_exts(self) -> frozenset[str]:
+        return frozenset(ext.lstrip(".").lower() for ext in self.ALLOWED_IMAGE_EXTENSIONS)
+
+    @computed_field
+    @cached_property
+    def allowed_video_exts(self) -> frozenset[str]:
+        return frozenset(ext.lstrip(".").lower() for ext in self.ALLOWED_VIDEO_EXTENSIONS)
 
 settings = Settings()
@@ -0,0 +1,80 @@
+import hashlib
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from cachetools import TTLCache
+from pydantic import BaseModel, ConfigDict
+
+from app.core.config import settings
+from app.models.schemas.users import User
+
+class CachedUser(BaseModel):
+    """Immutable snapshot of a verified user; never the password hash"""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: uuid.UUID
+    email: str
+    is_active: bool
+    is_superuser: bool
+    full_name: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    def to_user(self) -> User:
+        """A fresh, session-less User for one request"""
+        return User(**self.model_dump(), hashed_password="")
+
+# Maps sha256(token) -> (snapshot, expires_at). TTLCache bounds the overall
+# lifetime; expires_at additionally caps each entry by the token's own exp.
+# Snapshots rather than User instances, so concurrent requests on the same
+# token never share (or mutate) one ORM object.
+_token_cache: TTLCache = TTLCache(
+    maxsize=settings.JWT_CACHE_MAX, ttl=max(settings.JWT_CACHE_TTL, 0)
+)
+_lock = threading.Lock()
+
+def is_enabled() -> bool:
+    return settings.JWT_CACHE_TTL > 0
+
+def token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+def expiry(exp: Optional[float]) -> float:
+    """When an entry cached now must expire: JWT_CACHE_TTL, capped by exp"""
+    expires_at = time.time() + settings.JWT_CACHE_TTL
+    if exp is not None:
+        expires_at = min(expires_at, exp)
+    return expires_at
+
+def get_cached_user(key: bytes) -> Optional[User]:
+    """Return a fresh User for a cached token, if the entry is still valid"""
+    with _lock:
+        entry = _token_cache.get(key)
+    if entry is None:
+        return None
+    snapshot, expires_at = entry
+    if expires_at <= time.time():
+        with _lock:
+            _token_cache.pop(key, None)
+        return None
+    return snapshot.to_user()
+
+def cache_snapshot(key: bytes, snapshot: CachedUser, expires_at: float) -> None:
+    """Cache a snapshot until expires_at (an absolute time)"""
+    with _lock:
+        _token_cache[key] = (snapshot, expires_at)
+
+def cache_user(key: bytes, user: User, exp: Optional[float]) -> None:
+    """Cache a verified user, never past the token's own expiry"""
+    cache_snapshot(key, CachedUser.model_validate(user), expiry(exp))
+
+def invalidate_user(user_id: uuid.UUID) -> None:
+    """Drop every cached token entry belonging to a user"""
+    with _lock:
+        for key in list(_token_cache):
+            entry = _token_cache.get(key)
+            if entry is not None and entry[0].id == user_id:
+                _token_cache.pop(key, None)
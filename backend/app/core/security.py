@@ -20,6 +20,9 @@ def create_access_token(subject: str | Any, expires_delta: timedelta | None = No
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+# bcrypt is deliberately slow and blocks its thread. Call these from sync (def)
+# handlers, which FastAPI runs in its threadpool, or via run_in_threadpool from
+# async code, never directly on the event loop.
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -1,3 +1,4 @@
+from typing import Optional
 from sqlmodel import Session
 from app.models.schemas.users import User, UserCreate
 from app.models.repositories.users import UserRepository
@@ -6,3 +7,8 @@ def create_user(session: Session, user_create: UserCreate) -> User:
     """Create user using repository pattern"""
     repository = UserRepository(session)
     return repository.create(user_create)
+
+def get_user_by_email(session: Session, email: str) -> Optional[User]:
+    """Get user by email using repository pattern"""
+    repository = UserRepository(session)
+    return repository.get_by_email(email)
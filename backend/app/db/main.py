@@ -1,21 +1,32 @@
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, exists, select
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session
 from app.core.config import settings
 from app.models.schemas.users import User, UserCreate
 from app import crud
 
-# Build the complete database URI
-database_uri = f"{str(settings.SQLALCHEMY_DATABASE_URI)}?sslmode={settings.POSTGRES_SSL_MODE}"
+engine = create_engine(
+    settings.database_uri,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
 
-engine = create_engine(database_uri)
+SessionLocal = sessionmaker(
+    bind=engine,
+    class_=Session,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 def init_db(session: Session) -> None:
     """Initialize the database with default data"""
     # Create superuser if one doesn't exist
-    user = session.exec(
-        select(User).where(User.email == settings.FIRST_SUPERUSER)
-    ).first()
-    if not user:
+    superuser_exists = session.scalar(
+        select(exists().where(User.email == settings.FIRST_SUPERUSER))
+    )
+    if not superuser_exists:
         user_in = UserCreate(
             email=settings.FIRST_SUPERUSER,
             password=settings.FIRST_SUPERUSER_PASSWORD,
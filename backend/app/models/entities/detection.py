@@ -1,4 +1,5 @@
 from typing import Optional
+import uuid
 from pydantic import BaseModel, ConfigDict
 from app.models.entities.common import BaseEntity
 from app.models.entities.enums import DetectionStatus, MediaType, DetectionResult
@@ -12,7 +13,7 @@ class DetectionRequest(BaseModel):
 
 class DetectionResponse(BaseEntity):
     """Response model for deepfake detection results"""
-    user_id: Optional[str] = None
+    user_id: Optional[uuid.UUID] = None
     media_type: MediaType
     file_name: str
     file_path: str
@@ -34,6 +35,5 @@ class DetectionUpdate(BaseModel):
 class DetectionListResponse(BaseModel):
     """Response model for listing detections"""
     detections: list[DetectionResponse]
-    total: int
-    page: int
     per_page: int
+    next_cursor: Optional[str] = None
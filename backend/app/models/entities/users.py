@@ -1,4 +1,5 @@
 from typing import Optional
+import uuid
 from pydantic import BaseModel, EmailStr, ConfigDict
 
 class UserBase(BaseModel):
@@ -20,4 +21,4 @@ class UserUpdate(BaseModel):
 class UserResponse(UserBase):
     model_config = ConfigDict(from_attributes=True)
     
-    id: str
+    id: uuid.UUID
@@ -1,6 +1,8 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 import uuid
-from sqlmodel import Session, select, desc
+from sqlalchemy import tuple_
+from sqlmodel import Session, delete, desc, select, update
 from app.models.schemas.detection import Detection, DetectionCreate, DetectionUpdate
 
 class DetectionRepository:
@@ -11,61 +13,68 @@ class DetectionRepository:
         """Get detection by ID"""
         return self.session.get(Detection, detection_id)
 
-    def get_by_user_id(self, user_id: uuid.UUID, limit: int = 100, offset: int = 0) -> List[Detection]:
-        """Get detections by user ID with pagination"""
-        statement = (
-            select(Detection)
-            .where(Detection.user_id == user_id)
-            .order_by(desc(Detection.created_at))
-            .limit(limit)
-            .offset(offset)
-        )
-        return list(self.session.exec(statement).all())
+    def get_owner(self, detection_id: uuid.UUID) -> Optional[uuid.UUID]:
+        """Get the owning user's ID without loading the rest of the row"""
+        statement = select(Detection.user_id).where(Detection.id == detection_id)
+        return self.session.exec(statement).first()
 
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[Detection]:
-        """Get all detections with pagination"""
-        statement = (
-            select(Detection)
-            .order_by(desc(Detection.created_at))
-            .limit(limit)
-            .offset(offset)
-        )
+    def get_by_user_id_cursor(
+        self,
+        user_id: uuid.UUID,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None,
+        limit: int = 20,
+    ) -> List[Detection]:
+        """Get detections by user ID, newest first, after a (created_at, id) cursor"""
+        statement = select(Detection).where(Detection.user_id == user_id)
+        if cursor is not None:
+            # Bind the cursor with the columns' own types so it's rendered the
+            # way the stored values are (matters for SQLite's text timestamps)
+            position = tuple_(
+                *cursor, types=[Detection.created_at.type, Detection.id.type]
+            )
+            statement = statement.where(
+                tuple_(Detection.created_at, Detection.id) < position
+            )
+        statement = statement.order_by(
+            desc(Detection.created_at), desc(Detection.id)
+        ).limit(limit)
         return list(self.session.exec(statement).all())
 
     def create(self, detection_create: DetectionCreate) -> Detection:
         """Create a new detection record"""
         db_obj = Detection(**detection_create.model_dump())
         self.session.add(db_obj)
+        # id is generated client-side and the session doesn't expire on commit,
+        # so the object is already complete without a refresh SELECT
         self.session.commit()
-        self.session.refresh(db_obj)
         return db_obj
 
-    def update(self, detection: Detection, detection_update: DetectionUpdate) -> Detection:
-        """Update an existing detection record"""
+    def update(self, detection_id: uuid.UUID, detection_update: DetectionUpdate) -> Optional[Detection]:
+        """Update a detection record in a single UPDATE ... RETURNING"""
         update_data = detection_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(detection, field, value)
+        if not update_data:
+            return self.get(detection_id)
 
-        self.session.add(detection)
+        statement = (
+            update(Detection)
+            .where(Detection.id == detection_id)
+            .values(**update_data)
+            .returning(Detection)
+        )
+        detection = self.session.execute(statement).scalars().first()
         self.session.commit()
-        self.session.refresh(detection)
         return detection
 
-    def delete(self, detection_id: uuid.UUID) -> bool:
-        """Delete a detection record"""
-        detection = self.session.get(Detection, detection_id)
-        if detection:
-            self.session.delete(detection)
-            self.session.commit()
-            return True
-        return False
+    def delete(self, detection_id: uuid.UUID, user_id: Optional[uuid.UUID] = None) -> Optional[str]:
+        """Delete a detection record, only if owned by user_id when one is given
 
-    def count_by_user_id(self, user_id: uuid.UUID) -> int:
-        """Count detections by user ID"""
-        statement = select(Detection).where(Detection.user_id == user_id)
-        return len(list(self.session.exec(statement).all()))
-
-    def count_all(self) -> int:
-        """Count all detections"""
-        statement = select(Detection)
-        return len(list(self.session.exec(statement).all()))
+        Returns the deleted row's file_path, or None if no row matched.
+        """
+        statement = delete(Detection).where(Detection.id == detection_id)
+        if user_id is not None:
+            statement = statement.where(Detection.user_id == user_id)
+        file_path = self.session.execute(
+            statement.returning(Detection.file_path)
+        ).scalar_one_or_none()
+        self.session.commit()
+        return file_path
@@ -1,10 +1,23 @@
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
+import hashlib
+import hmac
+import threading
 import uuid
+from cachetools import TTLCache
+from sqlalchemy import exists
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased, make_transient_to_detached
 from sqlmodel import Session, select
 from app.models.schemas.users import User, UserCreate, UserUpdate
+from app.core.config import settings
 from app.core.security import get_password_hash, verify_password
 
 class UserRepository:
+    # Recent successful logins, keyed by an HMAC of the credentials, so repeated
+    # logins can skip bcrypt. Failures are never cached.
+    _auth_cache: TTLCache = TTLCache(maxsize=1000, ttl=30)
+    _auth_lock = threading.Lock()
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -17,6 +30,53 @@ class UserRepository:
         statement = select(User).where(User.email == email)
         return self.session.exec(statement).first()
 
+    def attach(self, user: User) -> User:
+        """Attach a user built from cached column values to this session
+
+        The copy is treated as already loaded, so no SELECT is issued.
+        """
+        make_transient_to_detached(user)
+        return self.session.merge(user, load=False)
+
+    def list_by_ids(self, ids: Sequence[uuid.UUID]) -> List[User]:
+        """Get all users whose ID is in ids"""
+        statement = select(User).where(User.id.in_(ids))
+        return list(self.session.exec(statement).all())
+
+    def list_by_emails(self, emails: Sequence[str]) -> List[User]:
+        """Get all users whose email is in emails"""
+        statement = select(User).where(User.email.in_(emails))
+        return list(self.session.exec(statement).all())
+
+    def get_for_update_with_email_conflict(
+        self, user_id: uuid.UUID, new_email: Optional[str]
+    ) -> Tuple[Optional[User], bool]:
+        """Lock a user row and check whether another user holds new_email
+
+        Both come back from one SELECT ... FOR UPDATE, and the row lock is held
+        until the caller's update commits.
+        """
+        conflict = False
+        if new_email is None:
+            statement = select(User).where(User.id == user_id).with_for_update()
+            return self.session.exec(statement).first(), conflict
+
+        other = aliased(User)
+        email_taken = (
+            exists()
+            .where(other.email == new_email, other.id != user_id)
+            .label("conflict")
+        )
+        statement = (
+            select(User, email_taken)
+            .where(User.id == user_id)
+            .with_for_update(of=User)
+        )
+        row = self.session.exec(statement).first()
+        if row is None:
+            return None, conflict
+        return row[0], bool(row[1])
+
     def create(self, user_create: UserCreate) -> User:
         """Create a new user"""
         hashed_password = get_password_hash(user_create.password)
@@ -27,8 +87,15 @@ class UserRepository:
             is_superuser=user_create.is_superuser,
         )
         self.session.add(db_obj)
-        self.session.commit()
-        self.session.refresh(db_obj)
+        # id is generated client-side and the session doesn't expire on commit,
+        # so the object is already complete without a refresh SELECT
+        try:
+            self.session.commit()
+        except IntegrityError:
+            # Leave the session usable for the caller; the unique index on
+            # email is what rejects duplicates
+            self.session.rollback()
+            raise
         return db_obj
 
     def update(self, user: User, user_update: UserUpdate) -> User:
@@ -44,14 +111,41 @@ class UserRepository:
 
         self.session.add(user)
         self.session.commit()
-        self.session.refresh(user)
         return user
 
     def authenticate(self, email: str, password: str) -> Optional[User]:
         """Authenticate user by email and password"""
-        user = self.get_by_email(email=email)
+        cache_key = self._auth_cache_key(email, password)
+        with self._auth_lock:
+            cached = self._auth_cache.get(cache_key)
+        if cached is not None:
+            user_id, hashed_password = cached
+            user = self.get(user_id)
+            # A changed email or password, or deactivation, voids the entry
+            if (
+                user
+                and user.is_active
+                and user.email == email
+                and user.hashed_password == hashed_password
+            ):
+                return user
+            with self._auth_lock:
+                self._auth_cache.pop(cache_key, None)
+
+        # Inactive users are filtered here so they never reach the bcrypt check
+        statement = select(User).where(User.email == email, User.is_active == True)  # noqa: E712
+        user = self.session.exec(statement).first()
         if not user:
             return None
         if not verify_password(password, user.hashed_password):
             return None
+        with self._auth_lock:
+            self._auth_cache[cache_key] = (user.id, user.hashed_password)
         return user
+
+    @staticmethod
+    def _auth_cache_key(email: str, password: str) -> bytes:
+        """Key login attempts without keeping the plaintext password around"""
+        return hmac.new(
+            settings.SECRET_KEY.encode(), f"{email}\0{password}".encode(), hashlib.sha256
+        ).digest()
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional
 import uuid
+from sqlalchemy import DateTime, Index, func
 from sqlmodel import Field, SQLModel
 
 from app.models.entities.enums import DetectionStatus, MediaType, DetectionResult
@@ -18,9 +19,27 @@ class DetectionBase(SQLModel):
     error_message: Optional[str] = None
 
 class Detection(DetectionBase, table=True):
+    # Fetch server-generated timestamps via RETURNING on UPDATE too, so they're
+    # loaded even though sessions don't expire or refresh after commit
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Serves the newest-first keyset listing; Postgres walks it backwards
+    __table_args__ = (
+        Index("ix_detection_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(default=None)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"onupdate": func.now()},
+    )
 
 class DetectionCreate(DetectionBase):
     pass
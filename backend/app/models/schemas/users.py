@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional
 import uuid
+from sqlalchemy import DateTime, func
 from sqlmodel import Field, SQLModel
 
 class UserBase(SQLModel):
@@ -10,10 +11,23 @@ class UserBase(SQLModel):
     full_name: Optional[str] = Field(default=None, max_length=255)
 
 class User(UserBase, table=True):
+    # Fetch server-generated timestamps via RETURNING on UPDATE too, so they're
+    # loaded even though sessions don't expire or refresh after commit
+    __mapper_args__ = {"eager_defaults": True}
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     hashed_password: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = Field(default=None)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"onupdate": func.now()},
+    )
 
 class UserCreate(UserBase):
     password: str
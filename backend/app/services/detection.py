@@ -1,10 +1,25 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, Tuple
+import base64
 import uuid
 from app.models.repositories.detection import DetectionRepository
 from app.models.schemas.detection import Detection, DetectionCreate, DetectionUpdate
 from app.models.entities.detection import DetectionListResponse, DetectionResponse
 from app.models.entities.enums import DetectionStatus
 
+def _encode_cursor(detection: Detection) -> str:
+    """Encode a detection's (created_at, id) position as an opaque cursor"""
+    raw = f"{detection.created_at.isoformat()}|{detection.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by _encode_cursor"""
+    try:
+        created_at, detection_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(detection_id)
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
 class DetectionService:
     def __init__(self, repository: DetectionRepository):
         self.repository = repository
@@ -13,48 +28,36 @@ class DetectionService:
         """Get detection by ID"""
         return self.repository.get(detection_id)
 
-    def get_user_detections(self, user_id: uuid.UUID, page: int = 1, per_page: int = 20) -> DetectionListResponse:
-        """Get detections for a specific user with pagination"""
-        if page < 1:
-            raise ValueError("Page number must be greater than 0")
+    def get_detection_owner(self, detection_id: uuid.UUID) -> Optional[uuid.UUID]:
+        """Get the ID of the user who owns a detection"""
+        return self.repository.get_owner(detection_id)
+
+    def get_user_detections_by_cursor(
+        self, user_id: uuid.UUID, cursor: Optional[str] = None, per_page: int = 20
+    ) -> DetectionListResponse:
+        """Get detections for a specific user, one keyset page at a time"""
         if per_page < 1 or per_page > 100:
             raise ValueError("Per page must be between 1 and 100")
 
-        offset = (page - 1) * per_page
-        detections = self.repository.get_by_user_id(user_id, limit=per_page, offset=offset)
-        total = self.repository.count_by_user_id(user_id)
-
-        detection_responses = [
-            DetectionResponse(**detection.model_dump()) for detection in detections
-        ]
-
-        return DetectionListResponse(
-            detections=detection_responses,
-            total=total,
-            page=page,
-            per_page=per_page
+        position = _decode_cursor(cursor) if cursor else None
+        # Fetch one extra row to learn whether another page follows
+        detections = self.repository.get_by_user_id_cursor(
+            user_id, cursor=position, limit=per_page + 1
         )
 
-    def get_all_detections(self, page: int = 1, per_page: int = 20) -> DetectionListResponse:
-        """Get all detections with pagination"""
-        if page < 1:
-            raise ValueError("Page number must be greater than 0")
-        if per_page < 1 or per_page > 100:
-            raise ValueError("Per page must be between 1 and 100")
-
-        offset = (page - 1) * per_page
-        detections = self.repository.get_all(limit=per_page, offset=offset)
-        total = self.repository.count_all()
+        next_cursor = None
+        if len(detections) > per_page:
+            detections = detections[:per_page]
+            next_cursor = _encode_cursor(detections[-1])
 
         detection_responses = [
-            DetectionResponse(**detection.model_dump()) for detection in detections
+            DetectionResponse.model_validate(detection) for detection in detections
         ]
 
         return DetectionListResponse(
             detections=detection_responses,
-            total=total,
-            page=page,
-            per_page=per_page
+            per_page=per_page,
+            next_cursor=next_cursor
         )
 
     def create_detection(self, detection_create: DetectionCreate) -> Detection:
@@ -63,19 +66,18 @@ class DetectionService:
 
     def update_detection(self, detection_id: uuid.UUID, detection_update: DetectionUpdate) -> Detection:
         """Update an existing detection record"""
-        detection = self.repository.get(detection_id)
+        detection = self.repository.update(detection_id, detection_update)
         if not detection:
             raise ValueError(f"Detection with ID {detection_id} not found")
 
-        return self.repository.update(detection, detection_update)
+        return detection
 
-    def delete_detection(self, detection_id: uuid.UUID) -> bool:
-        """Delete a detection record"""
-        detection = self.repository.get(detection_id)
-        if not detection:
-            raise ValueError(f"Detection with ID {detection_id} not found")
+    def delete_detection(self, detection_id: uuid.UUID, user_id: Optional[uuid.UUID] = None) -> Optional[str]:
+        """Delete a detection record, restricted to user_id's detections when given
 
-        return self.repository.delete(detection_id)
+        Returns the deleted detection's file_path, or None if nothing was deleted.
+        """
+        return self.repository.delete(detection_id, user_id=user_id)
 
     def start_detection_processing(self, detection_id: uuid.UUID) -> Detection:
         """Mark detection as processing"""
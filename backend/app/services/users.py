@@ -1,43 +1,129 @@
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional
+import threading
 import uuid
+from cachetools import TTLCache
+from sqlalchemy.exc import IntegrityError
 from app.models.repositories.users import UserRepository
 from app.models.schemas.users import User, UserCreate, UserUpdate
 
+# SQLSTATE for unique_violation
+UNIQUE_VIOLATION = "23505"
+
+def _is_unique_violation(error: IntegrityError) -> bool:
+    """Whether an IntegrityError came from a unique constraint"""
+    pgcode = getattr(error.orig, "pgcode", None)
+    if pgcode is not None:
+        return pgcode == UNIQUE_VIOLATION
+    # Drivers without SQLSTATEs (e.g. sqlite) only expose the message
+    return "unique" in str(error.orig).lower()
+
+# Hot-user lookups shared across requests (a service is built per request).
+# Both caches hold the same column values, never a session-bound User, and
+# are dropped on create/update; each hit is attached to the caller's session.
+_id_cache: TTLCache = TTLCache(maxsize=10000, ttl=60)
+_email_cache: TTLCache = TTLCache(maxsize=10000, ttl=60)
+_cache_lock = threading.RLock()
+
+# Keeps IN (...) lists well under driver/Postgres bind parameter limits
+BULK_LOOKUP_CHUNK_SIZE = 1000
+
 class UserService:
+    # Built per request; no per-instance __dict__ needed
+    __slots__ = ("repository",)
+
     def __init__(self, repository: UserRepository):
         self.repository = repository
 
     def get_user_by_id(self, user_id: uuid.UUID) -> Optional[User]:
         """Get user by ID"""
-        return self.repository.get(user_id)
+        with _cache_lock:
+            values = _id_cache.get(user_id)
+        if values is not None:
+            return self.repository.attach(User(**values))
+        user = self.repository.get(user_id)
+        if user:
+            self._cache_user(user)
+        return user
 
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        return self.repository.get_by_email(email)
+        with _cache_lock:
+            values = _email_cache.get(email)
+        if values is not None:
+            return self.repository.attach(User(**values))
+        user = self.repository.get_by_email(email)
+        if user:
+            self._cache_user(user)
+        return user
+
+    def get_users_by_ids(self, ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, User]:
+        """Get users by ID in bulk, keyed by ID; missing IDs are left out"""
+        unique_ids = list(dict.fromkeys(ids))
+        users: Dict[uuid.UUID, User] = {}
+        for start in range(0, len(unique_ids), BULK_LOOKUP_CHUNK_SIZE):
+            chunk = unique_ids[start:start + BULK_LOOKUP_CHUNK_SIZE]
+            for user in self.repository.list_by_ids(chunk):
+                users[user.id] = user
+        return users
+
+    def get_users_by_emails(self, emails: Iterable[str]) -> Dict[str, User]:
+        """Get users by email in bulk, keyed by email; missing emails are left out"""
+        unique_emails = list(dict.fromkeys(emails))
+        users: Dict[str, User] = {}
+        for start in range(0, len(unique_emails), BULK_LOOKUP_CHUNK_SIZE):
+            chunk = unique_emails[start:start + BULK_LOOKUP_CHUNK_SIZE]
+            for user in self.repository.list_by_emails(chunk):
+                users[user.email] = user
+        return users
 
     def create_user(self, user_create: UserCreate) -> User:
         """Create a new user"""
-        # Check if user already exists
-        existing_user = self.repository.get_by_email(user_create.email)
-        if existing_user:
-            raise ValueError(f"User with email {user_create.email} already exists")
-
-        return self.repository.create(user_create)
+        # Rely on the unique index on email instead of a SELECT before the INSERT
+        try:
+            user = self.repository.create(user_create)
+        except IntegrityError as e:
+            if not _is_unique_violation(e):
+                raise
+            raise ValueError(
+                f"User with email {user_create.email} already exists"
+            ) from None
+        self._invalidate_user(user.id, user.email)
+        return user
 
     def update_user(self, user_id: uuid.UUID, user_update: UserUpdate) -> User:
         """Update an existing user"""
-        user = self.repository.get(user_id)
+        # One locked read covers both the lookup and the email check, and the
+        # lock lasts until the update commits
+        user, email_taken = self.repository.get_for_update_with_email_conflict(
+            user_id, user_update.email or None
+        )
         if not user:
             raise ValueError(f"User with ID {user_id} not found")
 
-        # Check if email is being updated and already exists
-        if user_update.email and user_update.email != user.email:
-            existing_user = self.repository.get_by_email(user_update.email)
-            if existing_user:
-                raise ValueError(f"User with email {user_update.email} already exists")
+        if email_taken:
+            raise ValueError(f"User with email {user_update.email} already exists")
 
-        return self.repository.update(user, user_update)
+        old_email = user.email
+        user = self.repository.update(user, user_update)
+        self._invalidate_user(user_id, old_email, user.email)
+        return user
 
     def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """Authenticate user by email and password"""
         return self.repository.authenticate(email, password)
+
+    @staticmethod
+    def _cache_user(user: User) -> None:
+        """Cache a user's column values under both its ID and email"""
+        values: Dict[str, Any] = user.model_dump()
+        with _cache_lock:
+            _id_cache[user.id] = values
+            _email_cache[user.email] = values
+
+    @staticmethod
+    def _invalidate_user(user_id: uuid.UUID, *emails: Optional[str]) -> None:
+        """Drop cached entries for a user by ID and by each given email"""
+        with _cache_lock:
+            _id_cache.pop(user_id, None)
+            for email in emails:
+                _email_cache.pop(email, None)
@@ -0,0 +1,28 @@
+import uuid
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+
+from app.core.config import settings
+from app.models.repositories.users import UserRepository
+from app.models.schemas.users import User, UserCreate, UserUpdate
+
+def test_login_inactive_user_gets_generic_error(client: TestClient, db: Session):
+    """Test a deactivated account is refused like a wrong password, without a token"""
+    repository = UserRepository(db)
+    password = "inactive-password"
+    user = repository.create(
+        UserCreate(email=f"inactive-{uuid.uuid4().hex}@example.com", password=password)
+    )
+    try:
+        repository.update(user, UserUpdate(is_active=False))
+
+        r = client.post(
+            f"{settings.API_V1_STR}/authentication/access-token",
+            data={"username": user.email, "password": password},
+        )
+
+        assert r.status_code == 400
+        assert r.json() == {"detail": "Incorrect email or password"}
+    finally:
+        db.exec(delete(User).where(User.id == user.id))
+        db.commit()
@@ -0,0 +1,99 @@
+import pytest
+import time
+import uuid
+from unittest.mock import MagicMock
+from cachetools import TTLCache
+from fastapi.testclient import TestClient
+
+from app.api import deps
+from app.core import jwt_cache, security
+from app.core.config import settings
+from app.models.schemas.users import User
+
+@pytest.fixture
+def token_cache(monkeypatch):
+    """Enable the verified-token cache (off by default) with an empty store"""
+    monkeypatch.setattr(settings, "JWT_CACHE_TTL", 60)
+    monkeypatch.setattr(jwt_cache, "_token_cache", TTLCache(maxsize=100, ttl=60))
+    return jwt_cache._token_cache
+
+@pytest.fixture
+def active_user():
+    return User(
+        id=uuid.uuid4(),
+        email="cached@example.com",
+        hashed_password="hashed_password",
+        full_name="Cached User",
+        is_active=True,
+        is_superuser=False
+    )
+
+def test_get_current_user_cache_hit_skips_db(token_cache, active_user):
+    """Test a cached token is served without decoding it or touching the session"""
+    token = security.create_access_token(active_user.id)
+    session = MagicMock()
+    session.get.return_value = active_user
+
+    first = deps.get_current_user(session, token)
+    second = deps.get_current_user(session, token)
+
+    assert first is active_user
+    assert second.id == active_user.id
+    assert second.email == active_user.email
+    session.get.assert_called_once()
+
+def test_get_current_user_cache_hits_get_own_instances(token_cache, active_user):
+    """Test concurrent hits on one token never share a User instance"""
+    token = security.create_access_token(active_user.id)
+    session = MagicMock()
+    session.get.return_value = active_user
+    deps.get_current_user(session, token)
+
+    first = deps.get_current_user(session, token)
+    second = deps.get_current_user(session, token)
+    first.full_name = "Mutated"
+
+    assert first is not second
+    assert second.full_name == "Cached User"
+    assert second.hashed_password == ""
+
+def test_cached_token_expires_with_token_exp(token_cache, active_user, monkeypatch):
+    """Test an entry never outlives the token's own exp, even within JWT_CACHE_TTL"""
+    key = jwt_cache.token_key("token")
+    now = time.time()
+    jwt_cache.cache_user(key, active_user, exp=now + 5)
+
+    assert jwt_cache.get_cached_user(key) is not None
+
+    monkeypatch.setattr(jwt_cache.time, "time", lambda: now + 6)
+    assert jwt_cache.get_cached_user(key) is None
+    assert key not in token_cache
+
+def test_invalidate_user_evicts_only_their_tokens(token_cache, active_user):
+    """Test invalidation drops every token of the user and keeps everyone else's"""
+    other = active_user.model_copy(update={"id": uuid.uuid4()})
+    jwt_cache.cache_user(jwt_cache.token_key("a"), active_user, exp=None)
+    jwt_cache.cache_user(jwt_cache.token_key("b"), active_user, exp=None)
+    jwt_cache.cache_user(jwt_cache.token_key("c"), other, exp=None)
+
+    jwt_cache.invalidate_user(active_user.id)
+
+    assert jwt_cache.get_cached_user(jwt_cache.token_key("a")) is None
+    assert jwt_cache.get_cached_user(jwt_cache.token_key("b")) is None
+    assert jwt_cache.get_cached_user(jwt_cache.token_key("c")).id == other.id
+
+def test_update_user_me_invalidates_cached_token(
+    token_cache, client: TestClient, normal_user_token_headers: dict[str, str]
+):
+    """Test PATCH /me is visible on the next request with the same (cached) token"""
+    url = f"{settings.API_V1_STR}/users/me"
+    original = client.get(url, headers=normal_user_token_headers).json()["full_name"]
+    assert len(token_cache) == 1
+
+    try:
+        r = client.patch(url, headers=normal_user_token_headers, json={"full_name": "Renamed"})
+        assert r.status_code == 200
+
+        assert client.get(url, headers=normal_user_token_headers).json()["full_name"] == "Renamed"
+    finally:
+        client.patch(url, headers=normal_user_token_headers, json={"full_name": original})
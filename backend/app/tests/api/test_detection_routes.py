@@ -0,0 +1,76 @@
+import pytest
+from pathlib import Path
+from fastapi.testclient import TestClient
+
+from app.api.routes import detection as detection_routes
+from app.core.config import settings
+from app.services.detection import DetectionService
+
+UPLOAD_URL = f"{settings.API_V1_STR}/detection/upload"
+
+@pytest.fixture
+def upload_dir(monkeypatch, tmp_path) -> Path:
+    """Run uploads from a scratch directory; the route writes under ./uploads"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "uploads"
+
+def upload(client: TestClient, headers: dict[str, str], content: bytes = b"image-bytes"):
+    return client.post(
+        UPLOAD_URL,
+        headers=headers,
+        files={"file": ("photo.jpg", content, "image/jpeg")},
+        data={"media_type": "image"},
+    )
+
+def stored_files(upload_dir: Path) -> list[Path]:
+    return [path for path in upload_dir.rglob("*") if path.is_file()]
+
+def test_upload_oversize_file_leaves_nothing_on_disk(
+    client: TestClient, normal_user_token_headers: dict[str, str], upload_dir, monkeypatch
+):
+    """Test an upload over MAX_FILE_SIZE is rejected and no file is kept"""
+    monkeypatch.setattr(detection_routes, "MAX_FILE_SIZE", 4)
+
+    r = upload(client, normal_user_token_headers, content=b"too large")
+
+    assert r.status_code == 400
+    assert r.json()["detail"] == detection_routes.FILE_TOO_LARGE_MESSAGE
+    assert stored_files(upload_dir) == []
+
+def test_upload_db_failure_removes_stored_file(
+    client: TestClient, normal_user_token_headers: dict[str, str], upload_dir, monkeypatch
+):
+    """Test a failed detection insert doesn't leave the streamed file behind"""
+    def fail(self, detection_create):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(DetectionService, "create_detection", fail)
+
+    r = upload(client, normal_user_token_headers)
+
+    assert r.status_code == 500
+    assert stored_files(upload_dir) == []
+
+def test_upload_paths_are_unique_and_delete_removes_file(
+    client: TestClient, normal_user_token_headers: dict[str, str], upload_dir
+):
+    """Test same-named uploads get their own per-user files and DELETE unlinks them"""
+    first = upload(client, normal_user_token_headers).json()
+    second = upload(client, normal_user_token_headers).json()
+
+    first_path = Path(first["file_path"])
+    second_path = Path(second["file_path"])
+    assert first_path != second_path
+    assert first_path.parent == second_path.parent == Path("uploads", first["user_id"])
+    assert first["file_name"] == second["file_name"] == "photo.jpg"
+    assert first_path.exists() and second_path.exists()
+
+    for detection in (first, second):
+        r = client.delete(
+            f"{settings.API_V1_STR}/detection/{detection['id']}",
+            headers=normal_user_token_headers,
+        )
+        assert r.status_code == 200
+        assert not Path(detection["file_path"]).exists()
+
+    assert stored_files(upload_dir) == []
@@ -1,30 +1,72 @@
+import os
 from collections.abc import Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, delete
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, delete, text
 from unittest.mock import MagicMock
 
+from app.api.deps import get_db
 from app.core.config import settings
 from app.main import app
 from app.tests.utils.user import authentication_token_from_email
 from app.tests.utils.utils import get_superuser_token_headers
 from app.db.main import init_db, engine
 
+# Unit runs use a shared in-memory SQLite connection; set TEST_DATABASE=postgres
+# to run against the configured Postgres database for integration runs.
+USE_POSTGRES = os.getenv("TEST_DATABASE", "sqlite").lower() == "postgres"
+
+if USE_POSTGRES:
+    test_engine = engine
+else:
+    test_engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+TestSessionLocal = sessionmaker(
+    bind=test_engine,
+    class_=Session,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+def override_get_db() -> Generator[Session, None, None]:
+    session = TestSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
 # This fixture is used to create a new database session for each test function.
 @pytest.fixture(scope="session", autouse=True)
 def db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+    if not USE_POSTGRES:
+        SQLModel.metadata.create_all(test_engine)
+    app.dependency_overrides[get_db] = override_get_db
+    with TestSessionLocal() as session:
         init_db(session)
         yield session
         # Clean up after tests
-        from app.models.schemas.detection import Detection
-        from app.models.schemas.users import User
+        try:
+            if session.get_bind().dialect.name == "postgresql":
+                # One metadata-only statement instead of row-by-row deletes
+                session.exec(text('TRUNCATE TABLE detection, "user" RESTART IDENTITY CASCADE'))
+            else:
+                from app.models.schemas.detection import Detection
+                from app.models.schemas.users import User
 
-        # Delete all records in the correct order (child tables first)
-        session.exec(delete(Detection))
-        session.exec(delete(User))
-        session.commit()
+                # Delete all records in the correct order (child tables first)
+                session.exec(delete(Detection))
+                session.exec(delete(User))
+        finally:
+            session.commit()
+            app.dependency_overrides.pop(get_db, None)
 
 # This fixture is used to create a mock database session for each test function.
 @pytest.fixture
@@ -38,16 +80,16 @@ def db_session():
     session.add = MagicMock()
     return session
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
     with TestClient(app) as c:
         yield c
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def superuser_token_headers(client: TestClient) -> dict[str, str]:
     return get_superuser_token_headers(client)
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]:
     return authentication_token_from_email(
         client=client, email=settings.EMAIL_TEST_USER, db=db
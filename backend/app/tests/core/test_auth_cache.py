@@ -0,0 +1,96 @@
+import pytest
+import uuid
+from unittest.mock import MagicMock
+import fakeredis
+import redis
+from cachetools import TTLCache
+
+from app.core import auth_cache, jwt_cache
+from app.core.config import settings
+from app.models.schemas.users import User
+
+@pytest.fixture
+def redis_server():
+    return fakeredis.FakeServer()
+
+@pytest.fixture
+def redis_client(monkeypatch, redis_server):
+    """Enable both cache tiers, with Redis backed by an in-process fake"""
+    client = fakeredis.FakeRedis(server=redis_server)
+    monkeypatch.setattr(settings, "JWT_CACHE_TTL", 60)
+    monkeypatch.setattr(jwt_cache, "_token_cache", TTLCache(maxsize=100, ttl=60))
+    monkeypatch.setattr(auth_cache, "_redis", client)
+    return client
+
+@pytest.fixture
+def cached_user():
+    return User(
+        id=uuid.uuid4(),
+        email="redis@example.com",
+        hashed_password="hashed_password",
+        full_name="Redis User",
+        is_active=True,
+        is_superuser=False
+    )
+
+def test_redis_hit_builds_hashless_user(redis_client, cached_user):
+    """Test a token cached by another worker is served from Redis without the hash"""
+    key = auth_cache.token_key("token")
+    auth_cache.cache_user(key, cached_user, exp=None)
+    # Another worker: nothing in its local tier
+    jwt_cache._token_cache.clear()
+
+    user = auth_cache.get_cached_user(key)
+
+    assert user.id == cached_user.id
+    assert user.email == cached_user.email
+    assert user.hashed_password == ""
+    assert b"hashed_password" not in redis_client.get(auth_cache._redis_token_key(key))
+    # ...and the local tier is filled for the next request
+    assert jwt_cache.get_cached_user(key).id == cached_user.id
+
+def test_redis_miss(redis_client):
+    """Test an unknown token is a miss in both tiers"""
+    assert auth_cache.get_cached_user(auth_cache.token_key("unknown")) is None
+
+def test_invalidate_user_across_workers(redis_client, cached_user):
+    """Test invalidation removes the user's tokens from Redis via user:{id}:tokens"""
+    keys = [auth_cache.token_key(token) for token in ("a", "b")]
+    for key in keys:
+        auth_cache.cache_user(key, cached_user, exp=None)
+    tokens_key = auth_cache._redis_user_tokens_key(cached_user.id)
+    assert redis_client.scard(tokens_key) == 2
+
+    auth_cache.invalidate_user(cached_user.id)
+    jwt_cache._token_cache.clear()
+
+    assert not redis_client.exists(tokens_key)
+    assert all(auth_cache.get_cached_user(key) is None for key in keys)
+
+def test_corrupt_redis_entry_is_a_miss(redis_client):
+    """Test an unreadable or old-schema value falls through to the DB and is dropped"""
+    key = auth_cache.token_key("token")
+    redis_key = auth_cache._redis_token_key(key)
+    redis_client.set(redis_key, b'{"user": {"id": "not-a-uuid"}}')
+
+    assert auth_cache.get_cached_user(key) is None
+    assert not redis_client.exists(redis_key)
+
+def test_redis_down_is_a_miss(redis_client, redis_server, cached_user):
+    """Test an unreachable Redis never fails the request"""
+    redis_server.connected = False
+    key = auth_cache.token_key("token")
+
+    auth_cache.cache_user(key, cached_user, exp=None)
+    jwt_cache._token_cache.clear()
+
+    assert auth_cache.get_cached_user(key) is None
+    auth_cache.invalidate_user(cached_user.id)
+
+def test_redis_timeout_is_a_miss(redis_client, monkeypatch):
+    """Test a Redis timeout is treated as a cache miss"""
+    client = MagicMock()
+    client.get.side_effect = redis.TimeoutError("timed out")
+    monkeypatch.setattr(auth_cache, "_redis", client)
+
+    assert auth_cache.get_cached_user(auth_cache.token_key("token")) is None
@@ -0,0 +1,86 @@
+import pytest
+import uuid
+from sqlmodel import Session, delete
+
+from app.models.repositories import users as users_repository
+from app.models.repositories.users import UserRepository
+from app.models.schemas.users import User, UserCreate, UserUpdate
+
+PASSWORD = "correct-horse"
+
+@pytest.fixture(autouse=True)
+def clear_auth_cache():
+    UserRepository._auth_cache.clear()
+    yield
+    UserRepository._auth_cache.clear()
+
+@pytest.fixture
+def repository(db: Session):
+    return UserRepository(db)
+
+@pytest.fixture
+def user(repository: UserRepository, db: Session):
+    user = repository.create(
+        UserCreate(email=f"auth-{uuid.uuid4().hex}@example.com", password=PASSWORD)
+    )
+    yield user
+    db.exec(delete(User).where(User.id == user.id))
+    db.commit()
+
+@pytest.fixture
+def verify_calls(monkeypatch):
+    """Count bcrypt checks made by authenticate"""
+    calls = []
+    verify = users_repository.verify_password
+
+    def counting_verify(plain_password, hashed_password):
+        calls.append(plain_password)
+        return verify(plain_password, hashed_password)
+
+    monkeypatch.setattr(users_repository, "verify_password", counting_verify)
+    return calls
+
+def test_authenticate_cache_hit_skips_bcrypt(repository, user, verify_calls):
+    """Test a repeated successful login is served from the cache"""
+    assert repository.authenticate(user.email, PASSWORD).id == user.id
+    assert repository.authenticate(user.email, PASSWORD).id == user.id
+
+    assert len(verify_calls) == 1
+    assert len(UserRepository._auth_cache) == 1
+
+def test_authenticate_wrong_password_is_not_cached(repository, user, verify_calls):
+    """Test a failed login is a miss every time and never fills the cache"""
+    assert repository.authenticate(user.email, "wrong") is None
+    assert repository.authenticate(user.email, "wrong") is None
+
+    assert len(verify_calls) == 2
+    assert len(UserRepository._auth_cache) == 0
+
+def test_authenticate_rejects_old_password_after_change(repository, user):
+    """Test a cached login stops working once the password changes"""
+    assert repository.authenticate(user.email, PASSWORD) is not None
+
+    repository.update(user, UserUpdate(password="new-password"))
+
+    assert repository.authenticate(user.email, PASSWORD) is None
+    assert len(UserRepository._auth_cache) == 0
+    assert repository.authenticate(user.email, "new-password").id == user.id
+
+def test_authenticate_rejects_deactivated_user(repository, user):
+    """Test a cached login stops working once the user is deactivated"""
+    assert repository.authenticate(user.email, PASSWORD) is not None
+
+    repository.update(user, UserUpdate(is_active=False))
+
+    assert repository.authenticate(user.email, PASSWORD) is None
+    assert len(UserRepository._auth_cache) == 0
+
+def test_authenticate_rejects_old_email_after_change(repository, user):
+    """Test a cached login is keyed to the email it was made with"""
+    old_email = user.email
+    assert repository.authenticate(old_email, PASSWORD) is not None
+
+    repository.update(user, UserUpdate(email=f"renamed-{uuid.uuid4().hex}@example.com"))
+
+    assert repository.authenticate(old_email, PASSWORD) is None
+    assert repository.authenticate(user.email, PASSWORD).id == user.id
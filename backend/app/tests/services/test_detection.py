@@ -1,21 +1,30 @@
 import pytest
 import uuid
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
+from sqlmodel import delete
 
-from app.services.detection import DetectionService
+from app.services.detection import DetectionService, _decode_cursor, _encode_cursor
 from app.models.repositories.detection import DetectionRepository
 from app.models.schemas.detection import Detection, DetectionCreate, DetectionUpdate
 from app.models.entities.enums import DetectionStatus, MediaType, DetectionResult
+from app.tests.utils.user import create_random_user
 
-@pytest.fixture
-def mock_detection_repository():
+@pytest.fixture(scope="module")
+def shared_detection_repository():
+    # Built once per module; spec'ing the class on every test is the slow part
     return MagicMock(spec=DetectionRepository)
 
+@pytest.fixture
+def mock_detection_repository(shared_detection_repository):
+    yield shared_detection_repository
+    shared_detection_repository.reset_mock(return_value=True, side_effect=True)
+
 @pytest.fixture
 def detection_service(mock_detection_repository):
     return DetectionService(repository=mock_detection_repository)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_detection():
     return Detection(
         id=uuid.uuid4(),
@@ -26,7 +35,8 @@ def sample_detection():
         file_size=1024,
         status=DetectionStatus.COMPLETED,
         result=DetectionResult.FAKE,
-        confidence_score=0.95
+        confidence_score=0.95,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc)
     )
 
 def test_get_detection_by_id_success(detection_service, mock_detection_repository, sample_detection):
@@ -49,6 +59,16 @@ def test_get_detection_by_id_not_found(detection_service, mock_detection_reposit
     assert result is None
     mock_detection_repository.get.assert_called_once_with(detection_id)
 
+def test_get_detection_owner(detection_service, mock_detection_repository, sample_detection):
+    """Test owner lookup goes through the scalar repository query"""
+    mock_detection_repository.get_owner.return_value = sample_detection.user_id
+
+    result = detection_service.get_detection_owner(sample_detection.id)
+
+    assert result == sample_detection.user_id
+    mock_detection_repository.get_owner.assert_called_once_with(sample_detection.id)
+    mock_detection_repository.get.assert_not_called()
+
 def test_create_detection_success(detection_service, mock_detection_repository, sample_detection):
     """Test successful detection creation"""
     detection_create = DetectionCreate(
@@ -73,37 +93,120 @@ def test_update_detection_success(detection_service, mock_detection_repository,
         result=DetectionResult.REAL,
         confidence_score=0.85
     )
-    mock_detection_repository.get.return_value = sample_detection
     mock_detection_repository.update.return_value = sample_detection
     
     result = detection_service.update_detection(detection_id, detection_update)
     
     assert result == sample_detection
-    mock_detection_repository.get.assert_called_once_with(detection_id)
-    mock_detection_repository.update.assert_called_once_with(sample_detection, detection_update)
+    mock_detection_repository.get.assert_not_called()
+    mock_detection_repository.update.assert_called_once_with(detection_id, detection_update)
 
 def test_update_detection_not_found(detection_service, mock_detection_repository):
     """Test detection update when detection not found"""
     detection_id = uuid.uuid4()
     detection_update = DetectionUpdate(status=DetectionStatus.COMPLETED)
-    mock_detection_repository.get.return_value = None
+    mock_detection_repository.update.return_value = None
     
     with pytest.raises(ValueError, match=f"Detection with ID {detection_id} not found"):
         detection_service.update_detection(detection_id, detection_update)
     
-    mock_detection_repository.get.assert_called_once_with(detection_id)
-    mock_detection_repository.update.assert_not_called()
+    mock_detection_repository.update.assert_called_once_with(detection_id, detection_update)
 
-def test_get_user_detections_invalid_page(detection_service):
-    """Test get user detections with invalid page number"""
+def test_delete_detection_scoped_to_owner(detection_service, mock_detection_repository):
+    """Test deletion passes the owner through so it runs as a single scoped DELETE"""
+    detection_id = uuid.uuid4()
     user_id = uuid.uuid4()
-    
-    with pytest.raises(ValueError, match="Page number must be greater than 0"):
-        detection_service.get_user_detections(user_id, page=0)
+    mock_detection_repository.delete.return_value = "uploads/owner/file.jpg"
+
+    result = detection_service.delete_detection(detection_id, user_id=user_id)
+
+    assert result == "uploads/owner/file.jpg"
+    mock_detection_repository.get.assert_not_called()
+    mock_detection_repository.delete.assert_called_once_with(detection_id, user_id=user_id)
+
+def test_delete_detection_not_found(detection_service, mock_detection_repository):
+    """Test deleting a missing or foreign detection reports no deletion"""
+    mock_detection_repository.delete.return_value = None
 
-def test_get_user_detections_invalid_per_page(detection_service):
+    assert detection_service.delete_detection(uuid.uuid4(), user_id=uuid.uuid4()) is None
+
+def test_get_user_detections_by_cursor_invalid_per_page(detection_service):
     """Test get user detections with invalid per_page value"""
     user_id = uuid.uuid4()
     
     with pytest.raises(ValueError, match="Per page must be between 1 and 100"):
-        detection_service.get_user_detections(user_id, per_page=101)
+        detection_service.get_user_detections_by_cursor(user_id, per_page=101)
+
+def test_cursor_round_trip(sample_detection):
+    """Test a cursor decodes back to the detection's keyset position"""
+    cursor = _encode_cursor(sample_detection)
+
+    assert _decode_cursor(cursor) == (sample_detection.created_at, sample_detection.id)
+
+def test_get_user_detections_by_cursor(detection_service, mock_detection_repository, sample_detection):
+    """Test cursor pagination forwards the decoded position and fetches one extra row"""
+    user_id = uuid.uuid4()
+    mock_detection_repository.get_by_user_id_cursor.return_value = []
+
+    result = detection_service.get_user_detections_by_cursor(
+        user_id, cursor=_encode_cursor(sample_detection), per_page=10
+    )
+
+    assert result.detections == []
+    assert result.next_cursor is None
+    mock_detection_repository.get_by_user_id_cursor.assert_called_once_with(
+        user_id, cursor=(sample_detection.created_at, sample_detection.id), limit=11
+    )
+
+def test_get_user_detections_by_cursor_next_page(detection_service, mock_detection_repository, sample_detection):
+    """Test a full page returns a cursor pointing at its last detection"""
+    newer = sample_detection.model_copy(update={"id": uuid.uuid4()})
+    mock_detection_repository.get_by_user_id_cursor.return_value = [newer, sample_detection, sample_detection]
+
+    result = detection_service.get_user_detections_by_cursor(sample_detection.user_id, per_page=2)
+
+    assert [d.id for d in result.detections] == [newer.id, sample_detection.id]
+    assert result.detections[0].user_id == sample_detection.user_id
+    assert result.next_cursor == _encode_cursor(sample_detection)
+
+def test_get_user_detections_by_invalid_cursor(detection_service):
+    """Test a malformed cursor is rejected"""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        detection_service.get_user_detections_by_cursor(uuid.uuid4(), cursor="not-a-cursor")
+
+def test_get_user_detections_by_cursor_walks_all_pages(db):
+    """Test following next_cursor against the real database visits every detection once"""
+    user = create_random_user(db)["user"]
+    service = DetectionService(repository=DetectionRepository(db))
+    # Explicit timestamps, bound and stored the same way the cursor is; pairs
+    # share a created_at so the id tiebreak is exercised too
+    base_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    created = [
+        Detection(
+            user_id=user.id,
+            media_type=MediaType.IMAGE,
+            file_name=f"page-{i}.jpg",
+            file_path=f"/uploads/page-{i}.jpg",
+            file_size=1024,
+            created_at=base_time + timedelta(seconds=i // 2)
+        )
+        for i in range(7)
+    ]
+    db.add_all(created)
+    db.commit()
+    try:
+        seen = []
+        cursor = None
+        for _ in range(len(created)):
+            page = service.get_user_detections_by_cursor(user.id, cursor=cursor, per_page=2)
+            seen.extend(detection.id for detection in page.detections)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert cursor is None
+        expected = sorted(created, key=lambda d: (d.created_at, d.id), reverse=True)
+        assert seen == [detection.id for detection in expected]
+    finally:
+        db.exec(delete(Detection).where(Detection.user_id == user.id))
+        db.commit()
@@ -1,20 +1,37 @@
 import pytest
 import uuid
 from unittest.mock import MagicMock
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
 
+from app.services import users as users_service
 from app.services.users import UserService
 from app.models.repositories.users import UserRepository
 from app.models.schemas.users import User, UserCreate, UserUpdate
 
-@pytest.fixture
-def mock_user_repository():
+@pytest.fixture(autouse=True)
+def clear_user_caches():
+    users_service._id_cache.clear()
+    users_service._email_cache.clear()
+    yield
+    users_service._id_cache.clear()
+    users_service._email_cache.clear()
+
+@pytest.fixture(scope="module")
+def shared_user_repository():
+    # Built once per module; spec'ing the class on every test is the slow part
     return MagicMock(spec=UserRepository)
 
+@pytest.fixture
+def mock_user_repository(shared_user_repository):
+    yield shared_user_repository
+    shared_user_repository.reset_mock(return_value=True, side_effect=True)
+
 @pytest.fixture
 def user_service(mock_user_repository):
     return UserService(repository=mock_user_repository)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_user():
     return User(
         id=uuid.uuid4(),
@@ -45,6 +62,38 @@ def test_get_user_by_id_not_found(user_service, mock_user_repository):
     assert result is None
     mock_user_repository.get.assert_called_once_with(user_id)
 
+def test_get_users_by_ids(user_service, mock_user_repository, sample_user):
+    """Test bulk user lookup by ID"""
+    missing_id = uuid.uuid4()
+    mock_user_repository.list_by_ids.return_value = [sample_user]
+    
+    result = user_service.get_users_by_ids([sample_user.id, missing_id, sample_user.id])
+    
+    assert result == {sample_user.id: sample_user}
+    mock_user_repository.list_by_ids.assert_called_once_with([sample_user.id, missing_id])
+
+def test_get_users_by_ids_chunks(user_service, mock_user_repository, monkeypatch):
+    """Test that bulk lookups are split into fixed-size IN lists"""
+    monkeypatch.setattr(users_service, "BULK_LOOKUP_CHUNK_SIZE", 2)
+    ids = [uuid.uuid4() for _ in range(5)]
+    mock_user_repository.list_by_ids.return_value = []
+    
+    assert user_service.get_users_by_ids(ids) == {}
+    
+    chunks = [call.args[0] for call in mock_user_repository.list_by_ids.call_args_list]
+    assert chunks == [ids[0:2], ids[2:4], ids[4:5]]
+
+def test_get_users_by_emails(user_service, mock_user_repository, sample_user):
+    """Test bulk user lookup by email"""
+    mock_user_repository.list_by_emails.return_value = [sample_user]
+    
+    result = user_service.get_users_by_emails([sample_user.email, "missing@example.com"])
+    
+    assert result == {sample_user.email: sample_user}
+    mock_user_repository.list_by_emails.assert_called_once_with(
+        [sample_user.email, "missing@example.com"]
+    )
+
 def test_create_user_success(user_service, mock_user_repository, sample_user):
     """Test successful user creation"""
     user_create = UserCreate(
@@ -52,13 +101,12 @@ def test_create_user_success(user_service, mock_user_repository, sample_user):
         password="password123",
         full_name="Test User"
     )
-    mock_user_repository.get_by_email.return_value = None
     mock_user_repository.create.return_value = sample_user
     
     result = user_service.create_user(user_create)
     
     assert result == sample_user
-    mock_user_repository.get_by_email.assert_called_once_with("test@example.com")
+    mock_user_repository.get_by_email.assert_not_called()
     mock_user_repository.create.assert_called_once_with(user_create)
 
 def test_create_user_already_exists(user_service, mock_user_repository, sample_user):
@@ -67,13 +115,121 @@ def test_create_user_already_exists(user_service, mock_user_repository, sample_u
         email="test@example.com",
         password="password123"
     )
-    mock_user_repository.get_by_email.return_value = sample_user
+    orig = Exception("duplicate key value violates unique constraint")
+    orig.pgcode = "23505"
+    mock_user_repository.create.side_effect = IntegrityError("INSERT", {}, orig)
     
     with pytest.raises(ValueError, match="User with email test@example.com already exists"):
         user_service.create_user(user_create)
     
-    mock_user_repository.get_by_email.assert_called_once_with("test@example.com")
-    mock_user_repository.create.assert_not_called()
+    mock_user_repository.get_by_email.assert_not_called()
+    mock_user_repository.create.assert_called_once_with(user_create)
+
+def test_create_user_other_integrity_error(user_service, mock_user_repository):
+    """Test that non-unique integrity errors are not reported as duplicates"""
+    user_create = UserCreate(
+        email="test@example.com",
+        password="password123"
+    )
+    orig = Exception("null value in column violates not-null constraint")
+    orig.pgcode = "23502"
+    mock_user_repository.create.side_effect = IntegrityError("INSERT", {}, orig)
+    
+    with pytest.raises(IntegrityError):
+        user_service.create_user(user_create)
+
+def test_update_user_success(user_service, mock_user_repository, sample_user):
+    """Test successful user update with a single locked lookup"""
+    user_update = UserUpdate(email="new@example.com")
+    mock_user_repository.get_for_update_with_email_conflict.return_value = (sample_user, False)
+    mock_user_repository.update.return_value = sample_user
+    
+    result = user_service.update_user(sample_user.id, user_update)
+    
+    assert result == sample_user
+    mock_user_repository.get_for_update_with_email_conflict.assert_called_once_with(
+        sample_user.id, "new@example.com"
+    )
+    mock_user_repository.get.assert_not_called()
+    mock_user_repository.get_by_email.assert_not_called()
+    mock_user_repository.update.assert_called_once_with(sample_user, user_update)
+
+def test_update_user_not_found(user_service, mock_user_repository):
+    """Test user update when the user does not exist"""
+    user_id = uuid.uuid4()
+    mock_user_repository.get_for_update_with_email_conflict.return_value = (None, False)
+    
+    with pytest.raises(ValueError, match=f"User with ID {user_id} not found"):
+        user_service.update_user(user_id, UserUpdate(full_name="New Name"))
+    
+    mock_user_repository.update.assert_not_called()
+
+def test_update_user_email_taken(user_service, mock_user_repository, sample_user):
+    """Test user update when the new email belongs to another user"""
+    user_update = UserUpdate(email="taken@example.com")
+    mock_user_repository.get_for_update_with_email_conflict.return_value = (sample_user, True)
+    
+    with pytest.raises(ValueError, match="User with email taken@example.com already exists"):
+        user_service.update_user(sample_user.id, user_update)
+    
+    mock_user_repository.update.assert_not_called()
+
+def test_get_user_by_id_cached(user_service, mock_user_repository, sample_user):
+    """Test that repeated lookups by ID or email are served from the cache"""
+    mock_user_repository.get.return_value = sample_user
+    mock_user_repository.attach.side_effect = lambda user: user
+    
+    assert user_service.get_user_by_id(sample_user.id) == sample_user
+    cached_by_id = user_service.get_user_by_id(sample_user.id)
+    cached_by_email = user_service.get_user_by_email(sample_user.email)
+    
+    assert cached_by_id is not sample_user
+    assert cached_by_id.model_dump() == sample_user.model_dump()
+    assert cached_by_email.model_dump() == sample_user.model_dump()
+    mock_user_repository.get.assert_called_once_with(sample_user.id)
+    mock_user_repository.get_by_email.assert_not_called()
+    assert mock_user_repository.attach.call_count == 2
+
+def test_cached_user_is_attached_to_the_reading_session(db):
+    """Test a user cached by one session is usable from another without a SELECT"""
+    user = db.exec(select(User)).first()
+    first_session = Session(db.get_bind())
+    try:
+        UserService(repository=UserRepository(first_session)).get_user_by_id(user.id)
+    finally:
+        first_session.close()
+
+    with Session(db.get_bind()) as second_session:
+        repository = UserRepository(second_session)
+        repository.get = MagicMock(side_effect=AssertionError("cache miss"))
+        cached = UserService(repository=repository).get_user_by_id(user.id)
+
+        assert cached in second_session
+        assert cached.email == user.email
+        assert cached.hashed_password == user.hashed_password
+        assert not second_session.dirty
+
+def test_get_user_by_id_miss_not_cached(user_service, mock_user_repository):
+    """Test that missing users are looked up again"""
+    user_id = uuid.uuid4()
+    mock_user_repository.get.return_value = None
+    
+    assert user_service.get_user_by_id(user_id) is None
+    assert user_service.get_user_by_id(user_id) is None
+    
+    assert mock_user_repository.get.call_count == 2
+
+def test_update_user_invalidates_cache(user_service, mock_user_repository, sample_user):
+    """Test that updating a user drops its cached entries"""
+    mock_user_repository.get.return_value = sample_user
+    user_service.get_user_by_id(sample_user.id)
+    mock_user_repository.get_for_update_with_email_conflict.return_value = (sample_user, False)
+    mock_user_repository.update.return_value = sample_user
+    
+    user_service.update_user(sample_user.id, UserUpdate(full_name="New Name"))
+    user_service.get_user_by_id(sample_user.id)
+    
+    assert mock_user_repository.get.call_count == 2
 
 def test_authenticate_user_success(user_service, mock_user_repository, sample_user):
     """Test successful user authentication"""
@@ -5,6 +5,9 @@ from app import crud
 from app.core.config import settings
 from app.models.schemas.users import UserCreate
 
+# Auth headers per email, shared across test modules to skip repeat logins
+_token_cache: dict[str, dict[str, str]] = {}
+
 def user_authentication_headers(
     *, client: TestClient, email: str, password: str
 ) -> dict[str, str]:
@@ -19,8 +22,10 @@ def user_authentication_headers(
 def create_random_user(db: Session) -> dict:
     email = settings.EMAIL_TEST_USER
     password = "randompassword"
-    user_in = UserCreate(email=email, password=password)
-    user = crud.create_user(session=db, user_create=user_in)
+    user = crud.get_user_by_email(session=db, email=email)
+    if not user:
+        user_in = UserCreate(email=email, password=password)
+        user = crud.create_user(session=db, user_create=user_in)
     return {"user": user, "password": password}
 
 def authentication_token_from_email(
@@ -29,9 +34,17 @@ def authentication_token_from_email(
     """
     Return a valid token for the user with given email.
 
-    If the user doesn't exist it is created first.
+    If the user doesn't exist it is created first. Headers are memoized per
+    email for the rest of the test session.
     """
+    cached = _token_cache.get(email)
+    if cached is not None:
+        return cached
     password = "randompassword"
-    user_in = UserCreate(email=email, password=password)
-    user = crud.create_user(session=db, user_create=user_in)
-    return user_authentication_headers(client=client, email=email, password=password)
+    user = crud.get_user_by_email(session=db, email=email)
+    if not user:
+        user_in = UserCreate(email=email, password=password)
+        user = crud.create_user(session=db, user_create=user_in)
+    headers = user_authentication_headers(client=client, email=email, password=password)
+    _token_cache[email] = headers
+    return headers
@@ -4,23 +4,37 @@ Standalone configuration without database dependencies
 """
 
 import os
+import functools
 from pathlib import Path
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from typing import FrozenSet, Dict, Any
+from dataclasses import dataclass, field
 
-@dataclass
+@functools.lru_cache(maxsize=4096)
+def _suffix_lower(path: str) -> str:
+    """Lower-cased file extension, including the dot"""
+    return os.path.splitext(path)[1].lower()
+
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
-    """Configuration for the deepfake detection model"""
+    """Configuration for the deepfake detection model
+    
+    Immutable and hashable; derive variants with dataclasses.replace().
+    """
     
     # Model paths
-    model_path: str = "models/deepfake_detector.h5"
+    model_path: str = "models/deepfake_detector.keras"
     model_version: str = "v1.0"
     
     # Input specifications
     image_size: tuple = (224, 224)
     max_video_frames: int = 30
-    supported_image_formats: List[str] = None
-    supported_video_formats: List[str] = None
+    # Frozensets so format checks are a hash lookup
+    supported_image_formats: FrozenSet[str] = field(
+        default_factory=lambda: frozenset({'.jpg', '.jpeg', '.png', '.bmp'})
+    )
+    supported_video_formats: FrozenSet[str] = field(
+        default_factory=lambda: frozenset({'.mp4', '.avi', '.mov', '.mkv'})
+    )
     
     # Processing parameters
     confidence_threshold_fake: float = 0.7
@@ -32,11 +46,11 @@ class ModelConfig:
     max_video_size_mb: int = 100
     
     def __post_init__(self):
-        if self.supported_image_formats is None:
-            self.supported_image_formats = ['.jpg', '.jpeg', '.png', '.bmp']
-        
-        if self.supported_video_formats is None:
-            self.supported_video_formats = ['.mp4', '.avi', '.mov', '.mkv']
+        # Normalize caller-supplied formats (e.g. lists) so the instance stays hashable
+        for name in ('supported_image_formats', 'supported_video_formats'):
+            formats = getattr(self, name)
+            if not isinstance(formats, frozenset):
+                object.__setattr__(self, name, frozenset(f.lower() for f in formats))
     
     @property
     def model_full_path(self) -> Path:
@@ -45,11 +59,11 @@ class ModelConfig:
     
     def is_supported_image_format(self, file_path: str) -> bool:
         """Check if the image format is supported"""
-        return Path(file_path).suffix.lower() in self.supported_image_formats
+        return _suffix_lower(str(file_path)) in self.supported_image_formats
     
     def is_supported_video_format(self, file_path: str) -> bool:
         """Check if the video format is supported"""
-        return Path(file_path).suffix.lower() in self.supported_video_formats
+        return _suffix_lower(str(file_path)) in self.supported_video_formats
     
     def validate_file_size(self, file_path: str, is_video: bool = False) -> bool:
         """Validate file size against limits"""
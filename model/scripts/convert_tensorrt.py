@@ -0,0 +1,126 @@
+"""
+TensorRT conversion for deepfake detection models
+Builds a TF-TRT SavedModel (FP16 or INT8) from an exported SavedModel
+"""
+
+import os
+import sys
+import random
+import argparse
+import numpy as np
+import tensorflow as tf
+from pathlib import Path
+from tensorflow.python.compiler.tensorrt import trt_convert as trt
+
+# Add src to path to import our modules
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from config.model_config import ModelConfig
+from detector import DeepfakeDetector
+
+def device_tag() -> str:
+    """Compute capability of the first GPU (e.g. 'sm86'); engines only run on the arch they were built for"""
+    gpus = tf.config.list_physical_devices('GPU')
+    if not gpus:
+        raise RuntimeError("TensorRT conversion needs an NVIDIA GPU")
+    major, minor = tf.config.experimental.get_device_details(gpus[0])['compute_capability']
+    return f"sm{major}{minor}"
+
+def calibration_input_fn(calib_dir: str, config: ModelConfig, num_batches: int):
+    """Yield calibration batches from the detector's own preprocess_image
+
+    Same inputs the SavedModel sees at inference (cv2 resize, RGB, scaled to
+    [0, 1]), so the INT8 ranges match real traffic; see quantize_model.py.
+    """
+    paths = []
+    for root, _, files in os.walk(calib_dir):
+        paths.extend(os.path.join(root, name) for name in files if config.is_supported_image_format(name))
+    if not paths:
+        raise ValueError(f"No calibration images found in {calib_dir}")
+    paths.sort()
+    random.Random(1337).shuffle(paths)
+    detector = DeepfakeDetector(model_path="")
+
+    def _gen():
+        yielded = 0
+        batch = []
+        for path in paths:
+            if yielded >= num_batches:
+                break
+            image = detector.preprocess_image(path)
+            if image is None:
+                continue
+            batch.append(image)
+            if len(batch) == config.batch_size:
+                yielded += 1
+                yield (np.divide(np.concatenate(batch), np.float32(255.0), dtype=np.float32),)
+                batch = []
+        # A short final batch still calibrates better than dropping the images
+        if batch and yielded < num_batches:
+            yield (np.divide(np.concatenate(batch), np.float32(255.0), dtype=np.float32),)
+
+    return _gen
+
+def convert_model(saved_model_dir: str, output_dir: str, precision: str = 'FP16',
+                  calib_dir: str = None, num_calib_batches: int = 10,
+                  config: ModelConfig = ModelConfig()) -> str:
+    """Convert a SavedModel with TF-TRT and prebuild engines for the detector's batch shapes"""
+    precision_mode = getattr(trt.TrtPrecisionMode, precision)
+    if precision_mode == trt.TrtPrecisionMode.INT8 and not calib_dir:
+        raise ValueError("INT8 conversion needs --calib-dir for calibration")
+
+    # Single images, full video clips and directory batches
+    height, width = config.image_size
+    batch_sizes = sorted({1, config.max_video_frames, config.batch_size})
+
+    converter = trt.TrtGraphConverterV2(
+        input_saved_model_dir=saved_model_dir,
+        precision_mode=precision_mode,
+        use_calibration=precision_mode == trt.TrtPrecisionMode.INT8,
+        # One engine per prebuilt batch size; other shapes still build on first use
+        maximum_cached_engines=len(batch_sizes),
+        allow_build_at_runtime=True
+    )
+
+    print(f"Converting {saved_model_dir} with TF-TRT ({precision})...")
+    if precision_mode == trt.TrtPrecisionMode.INT8:
+        converter.convert(calibration_input_fn=calibration_input_fn(calib_dir, config, num_calib_batches))
+    else:
+        converter.convert()
+
+    def input_fn():
+        for batch_size in batch_sizes:
+            yield (np.zeros((batch_size, height, width, 3), dtype=np.float32),)
+
+    print(f"Building engines for batch sizes {batch_sizes}...")
+    converter.build(input_fn=input_fn)
+
+    os.makedirs(output_dir, exist_ok=True)
+    converter.save(output_dir)
+    print(f"TensorRT model saved to {output_dir}")
+    return output_dir
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert an exported deepfake detection SavedModel with TensorRT')
+    parser.add_argument('--saved-model-dir', required=True,
+                        help='SavedModel exported by train_model.py --export-dir')
+    parser.add_argument('--output-dir', help='Output directory (defaults next to the input, tagged by precision and GPU arch)')
+    parser.add_argument('--precision', choices=['FP32', 'FP16', 'INT8'], default='FP16', help='TensorRT precision')
+    parser.add_argument('--calib-dir', help='Directory of sample images for INT8 calibration')
+    parser.add_argument('--num-calib-batches', type=int, default=10, help='Number of INT8 calibration batches')
+
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or (
+        f"{args.saved_model_dir.rstrip(os.sep)}_trt_{args.precision.lower()}_{device_tag()}"
+    )
+    convert_model(
+        args.saved_model_dir,
+        output_dir,
+        precision=args.precision,
+        calib_dir=args.calib_dir,
+        num_calib_batches=args.num_calib_batches
+    )
+
+if __name__ == "__main__":
+    main()
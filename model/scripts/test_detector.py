@@ -3,8 +3,10 @@ Standalone testing script for the deepfake detector
 No backend or database dependencies
 """
 
+import os
 import sys
 import argparse
+from collections import Counter
 from pathlib import Path
 
 # Add src to path
@@ -20,19 +22,21 @@ def test_single_file(detector, file_path: str, media_type: MediaType):
     
     try:
         result = detector.detect(file_path, media_type)
-        
-        print(f"Result: {result.result.value}")
-        print(f"Confidence: {result.confidence_score:.4f}")
-        print(f"Processing time: {result.processing_time_seconds:.4f}s")
-        print(f"Model version: {result.model_version}")
-        print(f"Metadata: {result.metadata}")
-        
+        print_result(result)
         return result
         
     except Exception as e:
         print(f"Error: {str(e)}")
         return None
 
+def print_result(result):
+    """Print a single detection result"""
+    print(f"Result: {result.result.value}")
+    print(f"Confidence: {result.confidence_score:.4f}")
+    print(f"Processing time: {result.processing_time_seconds:.4f}s")
+    print(f"Model version: {result.model_version}")
+    print(f"Metadata: {result.metadata}")
+
 def test_directory(detector, directory: str, media_type: MediaType):
     """Test detection on all files in a directory"""
     directory_path = Path(directory)
@@ -47,10 +51,13 @@ def test_directory(detector, directory: str, media_type: MediaType):
     else:
         extensions = default_config.supported_video_formats
     
-    # Find all supported files
-    files = []
-    for ext in extensions:
-        files.extend(directory_path.glob(f"*{ext}"))
+    # Find all supported files in a single directory pass
+    exts = frozenset(ext.lower() for ext in extensions)
+    with os.scandir(directory_path) as it:
+        files = sorted(
+            entry.path for entry in it
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in exts
+        )
     
     if not files:
         print(f"No {media_type.value} files found in {directory}")
@@ -58,11 +65,22 @@ def test_directory(detector, directory: str, media_type: MediaType):
     
     print(f"Found {len(files)} {media_type.value} files")
     
+    # Run the whole directory through the batched path, then report per file
+    try:
+        batch_results = detector.detect_batch(files, media_type, batch_size=default_config.batch_size)
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return
+    
     results = []
-    for file_path in files:
-        result = test_single_file(detector, str(file_path), media_type)
-        if result:
-            results.append(result)
+    for file_path, result in zip(files, batch_results):
+        print(f"\nTesting {media_type.value}: {file_path}")
+        print("-" * 50)
+        if result is None:
+            print("Error: detection failed")
+            continue
+        print_result(result)
+        results.append(result)
     
     # Summary statistics
     if results:
@@ -70,17 +88,23 @@ def test_directory(detector, directory: str, media_type: MediaType):
         print("SUMMARY")
         print(f"{'='*60}")
         
-        fake_count = sum(1 for r in results if r.result.value == "fake")
-        real_count = sum(1 for r in results if r.result.value == "real")
-        uncertain_count = sum(1 for r in results if r.result.value == "uncertain")
+        # One pass over the results for every statistic
+        counts = Counter({"fake": 0, "real": 0, "uncertain": 0})
+        conf_sum = 0.0
+        time_sum = 0.0
+        for r in results:
+            counts[r.result.value] += 1
+            conf_sum += r.confidence_score
+            time_sum += r.processing_time_seconds
         
-        avg_confidence = sum(r.confidence_score for r in results) / len(results)
-        avg_time = sum(r.processing_time_seconds for r in results) / len(results)
+        n = len(results)
+        avg_confidence = conf_sum / n
+        avg_time = time_sum / n
         
-        print(f"Total files processed: {len(results)}")
-        print(f"Detected as FAKE: {fake_count}")
-        print(f"Detected as REAL: {real_count}")
-        print(f"Detected as UNCERTAIN: {uncertain_count}")
+        print(f"Total files processed: {n}")
+        print(f"Detected as FAKE: {counts['fake']}")
+        print(f"Detected as REAL: {counts['real']}")
+        print(f"Detected as UNCERTAIN: {counts['uncertain']}")
         print(f"Average confidence: {avg_confidence:.4f}")
         print(f"Average processing time: {avg_time:.4f}s")
 
@@ -10,7 +10,10 @@ import numpy as np
 import tensorflow as tf
 from pathlib import Path
 from typing import Tuple, Optional
-import json
+import orjson
+import glob
+import hashlib
+import tempfile
 from datetime import datetime
 
 # Add src to path to import our modules
@@ -18,15 +21,24 @@ sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from config.model_config import ModelConfig
 
+HAS_GPU = bool(tf.config.list_physical_devices('GPU'))
+
+# float16 activations only pay off on GPUs with Tensor Cores; on CPU they are slower
+if HAS_GPU:
+    tf.keras.mixed_precision.set_global_policy('mixed_float16')
+
 class DeepfakeTrainer:
     """Standalone trainer for deepfake detection models"""
     
-    def __init__(self, config: ModelConfig):
+    def __init__(self, config: ModelConfig, cache_dir: Optional[str] = None):
         self.config = config
+        # Decoded images are cached here after the first epoch; None keeps them in memory
+        self.cache_dir = cache_dir
         self.model = None
+        self.base_model = None
         self.history = None
         
-    def load_data(self, data_dir: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    def load_data(self, data_dir: str, batch_size: Optional[int] = None) -> Tuple[tf.data.Dataset, tf.data.Dataset]:
         """
         Load training data from directory structure:
         data_dir/
@@ -36,89 +48,146 @@ class DeepfakeTrainer:
         └── val/
             ├── real/
             └── fake/
+        
+        batch_size defaults to config.batch_size; pass the global batch size
+        when training under a distribution strategy.
         """
         print("Loading training data...")
+        batch_size = batch_size or self.config.batch_size
         
-        # This is a placeholder - implement your data loading logic
-        # You might want to use tf.keras.preprocessing.image.ImageDataGenerator
-        # or tf.data.Dataset for more efficient data loading
-        
-        # Example structure:
-        train_datagen = tf.keras.preprocessing.image.ImageDataGenerator(
-            rescale=1./255,
-            rotation_range=20,
-            width_shift_range=0.2,
-            height_shift_range=0.2,
-            horizontal_flip=True,
-            validation_split=0.2
-        )
-        
-        train_generator = train_datagen.flow_from_directory(
+        # Multi-threaded decode/resize via tf.data; augmentation lives in the model
+        # so it runs on the accelerator
+        train_ds, val_ds = tf.keras.utils.image_dataset_from_directory(
             os.path.join(data_dir, 'train'),
-            target_size=self.config.image_size,
-            batch_size=self.config.batch_size,
-            class_mode='binary',
-            subset='training'
+            validation_split=0.2,
+            subset='both',
+            seed=1337,
+            image_size=self.config.image_size,
+            batch_size=None,
+            label_mode='binary'
         )
         
-        val_generator = train_datagen.flow_from_directory(
-            os.path.join(data_dir, 'train'),
-            target_size=self.config.image_size,
-            batch_size=self.config.batch_size,
-            class_mode='binary',
-            subset='validation'
+        return (
+            self._prepare(train_ds, batch_size, self._cache_file(data_dir, 'train'), training=True),
+            self._prepare(val_ds, batch_size, self._cache_file(data_dir, 'val'))
         )
+    
+    @staticmethod
+    def _fingerprint(directory: str) -> str:
+        """Hash of every file's relative path, size and mtime under directory"""
+        digest = hashlib.sha1()
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                digest.update(f"{os.path.relpath(path, directory)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()[:12]
+    
+    def _cache_file(self, data_dir: str, split: str) -> str:
+        """Cache file for one split; '' means an in-memory cache
         
-        return train_generator, val_generator
+        Keyed by data directory, image size and a fingerprint of the training
+        files, so adding, removing or editing an image starts a fresh cache
+        rather than silently reusing the old one. Caches for an older file
+        listing, and partial caches left by an interrupted first epoch (which
+        would otherwise fail the next run on their .lockfile), are deleted.
+        """
+        if not self.cache_dir:
+            return ''
+        os.makedirs(self.cache_dir, exist_ok=True)
+        source = hashlib.sha1(os.path.abspath(data_dir).encode()).hexdigest()[:12]
+        height, width = self.config.image_size
+        prefix = os.path.join(self.cache_dir, f"{split}_{source}_{height}x{width}")
+        cache_file = f"{prefix}_{self._fingerprint(os.path.join(data_dir, 'train'))}"
+        
+        # tf.data writes <cache_file>.index only once the cache is complete
+        keep = set()
+        if os.path.exists(cache_file + '.index'):
+            keep = {cache_file + '.index', *glob.glob(glob.escape(cache_file) + '.data-*')}
+        for path in glob.glob(glob.escape(prefix) + '_*'):
+            if path not in keep:
+                os.remove(path)
+        return cache_file
+    
+    def _prepare(self, ds: tf.data.Dataset, batch_size: int, cache_file: str = '',
+                 training: bool = False) -> tf.data.Dataset:
+        """Rescale to [0, 1], cache decoded images, then batch and prefetch"""
+        ds = ds.map(lambda x, y: (x / 255.0, y), num_parallel_calls=tf.data.AUTOTUNE)
+        # Epoch 2+ read decoded tensors from the cache instead of re-decoding JPEGs
+        ds = ds.cache(cache_file)
+        if training:
+            ds = ds.shuffle(1000)
+        return ds.batch(batch_size).prefetch(tf.data.AUTOTUNE)
     
     def build_model(self) -> tf.keras.Model:
         """Build the deepfake detection model"""
         print("Building model architecture...")
         
-        # Example CNN architecture - customize based on your needs
-        model = tf.keras.Sequential([
-            tf.keras.layers.Conv2D(32, (3, 3), activation='relu', 
-                                 input_shape=(*self.config.image_size, 3)),
-            tf.keras.layers.MaxPooling2D(2, 2),
-            
-            tf.keras.layers.Conv2D(64, (3, 3), activation='relu'),
-            tf.keras.layers.MaxPooling2D(2, 2),
-            
-            tf.keras.layers.Conv2D(128, (3, 3), activation='relu'),
-            tf.keras.layers.MaxPooling2D(2, 2),
-            
-            tf.keras.layers.Conv2D(128, (3, 3), activation='relu'),
-            tf.keras.layers.MaxPooling2D(2, 2),
-            
-            tf.keras.layers.Flatten(),
-            tf.keras.layers.Dropout(0.5),
-            tf.keras.layers.Dense(512, activation='relu'),
-            tf.keras.layers.Dense(1, activation='sigmoid')  # Binary classification
-        ])
+        # Pretrained EfficientNetB0 backbone, frozen so only the new head trains
+        # first; train() then fine-tunes its top layers (see unfreeze_top_layers)
+        inputs = tf.keras.Input(shape=(*self.config.image_size, 3))
+        # Same augmentation as the old ImageDataGenerator; these layers are no-ops at inference
+        augmentation = tf.keras.Sequential([
+            tf.keras.layers.RandomFlip('horizontal'),
+            tf.keras.layers.RandomRotation(20 / 360),
+            tf.keras.layers.RandomTranslation(0.2, 0.2),
+        ], name='augmentation')
+        x = augmentation(inputs)
+        # Inputs arrive in [0, 1]; EfficientNet normalizes from [0, 255] internally
+        x = tf.keras.layers.Rescaling(255.0)(x)
+        base = tf.keras.applications.EfficientNetB0(
+            include_top=False,
+            weights='imagenet',
+            input_shape=(*self.config.image_size, 3)
+        )
+        base.trainable = False
+        self.base_model = base
+        # training=False keeps BatchNorm in inference mode in both phases
+        x = base(x, training=False)
+        x = tf.keras.layers.GlobalAveragePooling2D()(x)
+        x = tf.keras.layers.Dropout(0.3)(x)
+        # Keep the output in float32 for a numerically stable sigmoid/loss under mixed precision
+        outputs = tf.keras.layers.Dense(1, activation='sigmoid', dtype='float32')(x)  # Binary classification
+        model = tf.keras.Model(inputs, outputs)
+        self._compile(model, learning_rate=1e-3)
         
+        return model
+    
+    def _compile(self, model: tf.keras.Model, learning_rate: float) -> None:
+        """Compile with the shared loss/metrics at the given learning rate"""
         model.compile(
-            optimizer='adam',
+            optimizer=tf.keras.optimizers.Adam(learning_rate),
             loss='binary_crossentropy',
-            metrics=['accuracy', 'precision', 'recall']
+            metrics=['accuracy', 'precision', 'recall'],
+            # XLA-fused train/eval/predict steps on GPU; CPU-only runs keep the
+            # default kernels rather than risk unsupported-op compile failures
+            jit_compile=HAS_GPU
         )
-        
-        return model
     
-    def train(self, data_dir: str, epochs: int = 50, save_path: Optional[str] = None) -> None:
-        """Train the model"""
-        print(f"Starting training for {epochs} epochs...")
-        
-        # Load data
-        train_gen, val_gen = self.load_data(data_dir)
+    def unfreeze_top_layers(self, num_layers: int, learning_rate: float = 1e-5) -> None:
+        """Make the backbone's top num_layers trainable and recompile for fine-tuning
         
-        # Build model
-        self.model = self.build_model()
-        
-        # Print model summary
-        self.model.summary()
+        BatchNormalization layers stay frozen so their ImageNet statistics
+        aren't disturbed by small fine-tuning batches. The low learning rate
+        keeps the pretrained weights from being wiped out by the first updates.
+        """
+        if self.model is None or self.base_model is None:
+            raise ValueError("Model not built yet")
         
-        # Callbacks
-        callbacks = [
+        self.base_model.trainable = True
+        for index, layer in enumerate(self.base_model.layers):
+            layer.trainable = (
+                index >= len(self.base_model.layers) - num_layers
+                and not isinstance(layer, tf.keras.layers.BatchNormalization)
+            )
+        # Changing trainable flags only takes effect after a recompile
+        self._compile(self.model, learning_rate=learning_rate)
+    
+    @staticmethod
+    def _callbacks(min_lr: float) -> list:
+        """Fresh early-stopping / LR-schedule callbacks for one fit() phase"""
+        return [
             tf.keras.callbacks.EarlyStopping(
                 monitor='val_loss',
                 patience=10,
@@ -128,35 +197,88 @@ class DeepfakeTrainer:
                 monitor='val_loss',
                 factor=0.2,
                 patience=5,
-                min_lr=0.0001
+                min_lr=min_lr
             )
         ]
+    
+    def train(self, data_dir: str, epochs: int = 50, save_path: Optional[str] = None,
+              export_dir: Optional[str] = None, fine_tune_epochs: int = 10,
+              fine_tune_layers: int = 20) -> None:
+        """Train the model
+        
+        Runs up to `epochs` epochs on the new head with the backbone frozen,
+        then up to `fine_tune_epochs` more with the backbone's top
+        `fine_tune_layers` layers unfrozen at a lower learning rate.
+        """
+        print(f"Starting training for {epochs} epochs...")
+        
+        # Data-parallel over all local GPUs (a single default device otherwise);
+        # each replica keeps config.batch_size, so the global batch scales with them
+        strategy = tf.distribute.MirroredStrategy()
+        global_batch_size = self.config.batch_size * strategy.num_replicas_in_sync
+        print(f"Training on {strategy.num_replicas_in_sync} replica(s), global batch size {global_batch_size}")
         
-        # Train the model
+        # Load data
+        train_ds, val_ds = self.load_data(data_dir, batch_size=global_batch_size)
+        
+        # Build model; variables must be created under the strategy scope
+        with strategy.scope():
+            self.model = self.build_model()
+        
+        # Print model summary
+        self.model.summary()
+        
+        # Warm up the head on the frozen backbone
         self.history = self.model.fit(
-            train_gen,
+            train_ds,
             epochs=epochs,
-            validation_data=val_gen,
-            callbacks=callbacks,
+            validation_data=val_ds,
+            callbacks=self._callbacks(min_lr=1e-4),
             verbose=1
         )
         
+        # Fine-tune the top of the backbone, continuing the epoch count
+        if fine_tune_epochs > 0 and fine_tune_layers > 0:
+            print(f"Fine-tuning the top {fine_tune_layers} backbone layers for {fine_tune_epochs} epochs...")
+            with strategy.scope():
+                self.unfreeze_top_layers(fine_tune_layers)
+            initial_epoch = len(self.history.epoch)
+            fine_tune_history = self.model.fit(
+                train_ds,
+                epochs=initial_epoch + fine_tune_epochs,
+                initial_epoch=initial_epoch,
+                validation_data=val_ds,
+                callbacks=self._callbacks(min_lr=1e-7),
+                verbose=1
+            )
+            for key, values in fine_tune_history.history.items():
+                self.history.history.setdefault(key, []).extend(values)
+        
         # Save model
         if save_path is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_path = f"models/deepfake_detector_{timestamp}.h5"
+            save_path = f"models/deepfake_detector_{timestamp}.keras"
+        elif not save_path.endswith(('.keras', '.h5')):
+            save_path = f"{save_path}.keras"
         
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        # Native Keras format (zipped config + weights); .h5 is still accepted as legacy
+        os.makedirs(os.path.dirname(save_path) or '.', exist_ok=True)
         self.model.save(save_path)
         print(f"Model saved to {save_path}")
         
+        # Inference-only SavedModel for tf.saved_model.load / TF Serving
+        if export_dir:
+            self.model.export(export_dir)
+            print(f"SavedModel exported to {export_dir}")
+        
         # Save training history
-        history_path = save_path.replace('.h5', '_history.json')
-        with open(history_path, 'w') as f:
-            # Convert numpy arrays to lists for JSON serialization
-            history_dict = {key: [float(val) for val in values] 
-                          for key, values in self.history.history.items()}
-            json.dump(history_dict, f, indent=2)
+        history_path = f"{os.path.splitext(save_path)[0]}_history.json"
+        # orjson serializes the numpy arrays directly, no per-value float() loop
+        history_dict = {key: np.asarray(values, dtype=np.float32)
+                        for key, values in self.history.history.items()}
+        Path(history_path).write_bytes(
+            orjson.dumps(history_dict, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2)
+        )
         print(f"Training history saved to {history_path}")
     
     def evaluate(self, test_data_dir: str) -> dict:
@@ -167,17 +289,19 @@ class DeepfakeTrainer:
         print("Evaluating model...")
         
         # Load test data
-        test_datagen = tf.keras.preprocessing.image.ImageDataGenerator(rescale=1./255)
-        test_generator = test_datagen.flow_from_directory(
+        test_ds = tf.keras.utils.image_dataset_from_directory(
             test_data_dir,
-            target_size=self.config.image_size,
+            image_size=self.config.image_size,
             batch_size=self.config.batch_size,
-            class_mode='binary',
+            label_mode='binary',
             shuffle=False
         )
+        test_ds = test_ds.map(
+            lambda x, y: (x / 255.0, y), num_parallel_calls=tf.data.AUTOTUNE
+        ).prefetch(tf.data.AUTOTUNE)
         
         # Evaluate
-        results = self.model.evaluate(test_generator, verbose=1)
+        results = self.model.evaluate(test_ds, verbose=1)
         
         # Create results dictionary
         metrics = {}
@@ -193,21 +317,31 @@ class DeepfakeTrainer:
 def main():
     parser = argparse.ArgumentParser(description='Train deepfake detection model')
     parser.add_argument('--data-dir', required=True, help='Path to training data directory')
-    parser.add_argument('--epochs', type=int, default=50, help='Number of training epochs')
+    parser.add_argument('--epochs', type=int, default=50, help='Number of epochs with the backbone frozen')
+    parser.add_argument('--fine-tune-epochs', type=int, default=10,
+                       help='Epochs fine-tuning the top backbone layers afterwards (0 skips it)')
+    parser.add_argument('--fine-tune-layers', type=int, default=20,
+                       help='Number of top backbone layers unfrozen for fine-tuning')
     parser.add_argument('--model-path', help='Path to save the trained model')
+    parser.add_argument('--export-dir', help='Also export an inference SavedModel to this directory')
     parser.add_argument('--test-dir', help='Path to test data for evaluation')
+    parser.add_argument('--cache-dir', default=os.path.join(tempfile.gettempdir(), 'deepfake_cache'),
+                       help="Directory for the decoded-image cache ('' caches in memory)")
     
     args = parser.parse_args()
     
     # Create trainer
     config = ModelConfig()
-    trainer = DeepfakeTrainer(config)
+    trainer = DeepfakeTrainer(config, cache_dir=args.cache_dir)
     
     # Train model
     trainer.train(
         data_dir=args.data_dir,
         epochs=args.epochs,
-        save_path=args.model_path
+        save_path=args.model_path,
+        export_dir=args.export_dir,
+        fine_tune_epochs=args.fine_tune_epochs,
+        fine_tune_layers=args.fine_tune_layers
     )
     
     # Evaluate if test data provided